@@ -13,12 +13,17 @@ Usage:
 """
 
 import sys
+from datetime import datetime
 from pathlib import Path
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+# Resolved once per invocation; used to name dated output files
+OUTPUT_ROOT = PROJECT_ROOT / 'output'
+_TODAY = datetime.now().strftime('%Y%m%d')
+
 import click
 from rich.console import Console
 from rich.panel import Panel
@@ -40,26 +45,42 @@ def cli():
 @click.option('--category', '-c', multiple=True, help='Dork categories (careers, hiring_signals, tech_stack, funding, remote)')
 @click.option('--all', '-a', 'all_categories', is_flag=True, help='Use all categories')
 @click.option('--format', '-f', type=click.Choice(['table', 'urls', 'csv']), default='urls')
-@click.option('--output', '-o', type=click.Path(), help='Output file path')
-def discover(category, all_categories, format, output):
+@click.option('--output', '-o', type=click.Path(allow_dash=True), help="Output file path ('-' with urls: bare URLs to stdout)")
+@click.option('--cache', 'use_cache', is_flag=True, help='Reuse the last 24h result from data/leads.db (only pays off for large role/tech lists)')
+def discover(category, all_categories, format, output, use_cache):
     """Generate Google dork queries for discovery."""
-    from src.discovery.dork_engine import DorkEngine, ALL_DORKS
+    from src.discovery.dork_engine import DorkEngine
     
     engine = DorkEngine()
     
-    categories = list(ALL_DORKS.keys()) if all_categories else (list(category) if category else None)
-    queries = engine.generate_queries(categories=categories)
+    categories = None if all_categories else (list(category) or None)
+    if use_cache:
+        queries = engine.cached_queries(categories=categories)
+    else:
+        queries = engine.iter_queries(categories=categories)
     
-    console.print(f"\n[bold]Generated {len(queries)} dork queries[/bold]\n")
+    if format == 'urls' and output == '-':
+        # Bare URLs for piping (xargs, scrape); no Rich output on stdout
+        urls = b'\n'.join(q['google_url'].encode('utf-8') for q in queries)
+        if urls:
+            sys.stdout.buffer.write(urls + b'\n')
+            sys.stdout.buffer.flush()
+        return
     
-    if format == 'table':
-        engine.export_queries_table(queries)
-    elif format == 'urls':
-        output_path = Path(output) if output else PROJECT_ROOT / 'output' / 'dork_urls.txt'
+    if format == 'urls':
+        # Stream straight to disk; no need to hold every query in memory
+        output_path = Path(output) if output else OUTPUT_ROOT / 'dork_urls.txt'
         engine.export_urls(queries, output_path)
-    elif format == 'csv':
-        output_path = Path(output) if output else PROJECT_ROOT / 'output' / 'dork_queries.csv'
-        engine.export_csv(queries, output_path)
+    else:
+        queries = list(queries)
+        
+        console.print(f"\n[bold]Generated {len(queries)} dork queries[/bold]\n")
+        
+        if format == 'table':
+            engine.export_queries_table(queries)
+        elif format == 'csv':
+            output_path = Path(output) if output else OUTPUT_ROOT / 'dork_queries.csv'
+            engine.export_csv(queries, output_path)
     
     console.print("\n[cyan]Next: Open URLs in browser, collect domains, then run 'scrape'[/cyan]")
 
@@ -70,12 +91,22 @@ def discover(category, all_categories, format, output):
 @click.option('--input', '-i', 'input_file', type=click.Path(exists=True), help='File with domains')
 @click.option('--output', '-o', type=click.Path(), help='Output directory')
 @click.option('--max-pages', '-m', default=5, help='Max pages per domain')
-def scrape(url, domain, input_file, output, max_pages):
+@click.option('--concurrency', '-c', default=20, help='Max domains scraped in parallel')
+@click.option('--per-host-delay', type=float, help='Seconds between requests to one host (default: the configured jittered delay)')
+@click.option('--checkpoint-ttl', type=float, help='Reuse pages fetched within this many hours instead of fetching them again (resume)')
+@click.option('--format', '-f', 'fmt', type=click.Choice(['csv', 'parquet']), default='parquet', help='Output format')
+@click.option('--engine', type=click.Choice(['re', 'hyperscan', 'ahocorasick']), default='re', help='Keyword matching engine')
+@click.option('--workers', '-w', default=0, help='Processes for HTML parsing/extraction with --input (0 = inline, -1 = one per CPU)')
+@click.option('--page-cache', is_flag=True, help='Revalidate previously scraped pages with conditional GETs and reuse unchanged ones')
+def scrape(url, domain, input_file, output, max_pages, concurrency, per_host_delay, checkpoint_ttl, fmt, engine, workers, page_cache):
     """Scrape company websites for job intelligence."""
+    import asyncio
     from src.extraction.scraper import JobMarketScraper
     
-    scraper = JobMarketScraper()
-    output_dir = Path(output) if output else PROJECT_ROOT / 'output' / 'scrape_results'
+    scraper = JobMarketScraper(
+        checkpoint_ttl_hours=checkpoint_ttl, engine=engine, workers=workers, page_cache=page_cache
+    )
+    output_dir = Path(output) if output else OUTPUT_ROOT / 'scrape_results'
     
     if url:
         console.print(f"[cyan]Scraping URL: {url}[/cyan]")
@@ -90,17 +121,19 @@ def scrape(url, domain, input_file, output, max_pages):
     elif domain:
         console.print(f"[cyan]Scraping domain: {domain}[/cyan]")
         profile = scraper.scrape_domain(domain, max_pages)
-        scraper.export_profiles_csv(output_dir / 'profiles.csv')
-        scraper.export_pages_csv(output_dir / 'pages.csv')
+        scraper.export_results(output_dir, fmt)
     
     elif input_file:
-        with open(input_file) as f:
-            domains = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+        from src.utils.domain_list import iter_domains
+        # Materialized: the async scraper interleaves domains by host and
+        # prewarms DNS, which both need the whole set up front
+        domains = list(iter_domains(input_file))
         
         console.print(f"[cyan]Scraping {len(domains)} domains...[/cyan]")
-        scraper.scrape_domains(domains, max_pages)
-        scraper.export_profiles_csv(output_dir / 'profiles.csv')
-        scraper.export_pages_csv(output_dir / 'pages.csv')
+        asyncio.run(scraper.scrape_domains_async(
+            domains, max_pages, concurrency=concurrency, per_host_delay=per_host_delay
+        ))
+        scraper.export_results(output_dir, fmt)
         console.print(f"\n[green]Complete! Results in {output_dir}[/green]")
     
     else:
@@ -111,29 +144,33 @@ def scrape(url, domain, input_file, output, max_pages):
 
 
 @cli.command()
-@click.option('--input', '-i', 'input_file', type=click.Path(exists=True), help='Input profiles CSV')
+@click.option('--input', '-i', 'input_file', type=click.Path(exists=True), help='Input profiles CSV or Parquet')
+@click.option('--format', '-f', 'fmt', type=click.Choice(['csv', 'parquet']), help='Default profiles format to look for')
 @click.option('--priority', '-p', type=click.Choice(['high', 'medium', 'low']), help='Filter by priority')
 @click.option('--limit', '-l', default=50, help='Max leads to show')
 @click.option('--output', '-o', type=click.Path(), help='Output CSV path')
-def score(input_file, priority, limit, output):
+@click.option('--workers', '-w', default=0, help='Processes for keyword matching (0 = inline, -1 = one per CPU)')
+def score(input_file, fmt, priority, limit, output, workers):
     """Score and prioritize leads."""
-    from src.scoring.scorer import LeadScorer, load_companies_from_csv
-    from datetime import datetime
+    from src.scoring.scorer import LeadScorer, load_companies
     
-    # Find input file
+    # Find input file (Parquet preferred, unless --format says otherwise)
     if not input_file:
-        default_input = PROJECT_ROOT / 'output' / 'scrape_results' / 'profiles.csv'
-        if default_input.exists():
-            input_file = str(default_input)
+        results_dir = OUTPUT_ROOT / 'scrape_results'
+        formats = [fmt] if fmt else ['parquet', 'csv']
+        candidates = [results_dir / f'profiles.{ext}' for ext in formats]
+        existing = [p for p in candidates if p.exists()]
+        if existing:
+            input_file = str(existing[0])
         else:
-            console.print("[red]No profiles.csv found. Run 'scrape' first.[/red]")
+            console.print("[red]No profiles file found. Run 'scrape' first.[/red]")
             return
     
     console.print(f"[cyan]Loading from {input_file}...[/cyan]")
-    companies = load_companies_from_csv(Path(input_file))
+    companies = load_companies(Path(input_file))
     
-    scorer = LeadScorer()
-    scores = scorer.score_companies(companies)
+    scorer = LeadScorer(workers=workers)
+    scores = scorer.score_batch(companies)
     
     if priority:
         scores = scorer.filter_leads(scores, priority=priority)
@@ -141,14 +178,14 @@ def score(input_file, priority, limit, output):
     scorer.display_scores(scores, limit=limit)
     
     # Summary
-    high = len([s for s in scores if s.priority == 'high'])
-    med = len([s for s in scores if s.priority == 'medium'])
+    high = scores.count('high')
+    med = scores.count('medium')
     
     console.print(f"\n[bold]Summary:[/bold] {high} high, {med} medium priority leads")
     
     # Export
-    output_path = Path(output) if output else PROJECT_ROOT / 'output' / 'reports' / f'scored_leads_{datetime.now().strftime("%Y%m%d")}.csv'
-    scorer.export_csv(scores[:limit], output_path)
+    output_path = Path(output) if output else OUTPUT_ROOT / 'reports' / f'scored_leads_{_TODAY}.csv'
+    scorer.export_csv(scores.to_lead_scores(limit), output_path)
 
 
 @cli.command('detect-changes')
@@ -157,25 +194,26 @@ def score(input_file, priority, limit, output):
 def detect_changes(domains, all_high):
     """Detect changes on monitored companies."""
     from src.extraction.change_detector import ChangeDetector
-    from datetime import datetime
     
     detector = ChangeDetector()
     
     if all_high:
         scores = detector.db.get_latest_scores(priority='high')
         domain_list = [s['domain'] for s in scores]
+        console.print(f"[cyan]Checking {len(domain_list)} domains...[/cyan]")
     elif domains:
-        with open(domains) as f:
-            domain_list = [line.strip() for line in f if line.strip()]
+        from src.utils.domain_list import iter_domains
+        # Streamed: run_detection reads the file as domains are checked
+        domain_list = iter_domains(domains)
+        console.print(f"[cyan]Checking domains from {domains}...[/cyan]")
     else:
         console.print("[red]Please provide --domains or --all-high[/red]")
         return
     
-    console.print(f"[cyan]Checking {len(domain_list)} domains...[/cyan]")
     changes = detector.run_detection(domain_list)
     detector.display_changes(changes)
     
-    output_path = PROJECT_ROOT / 'output' / 'alerts' / f'changes_{datetime.now().strftime("%Y%m%d")}.json'
+    output_path = OUTPUT_ROOT / 'alerts' / f'changes_{_TODAY}.json'
     detector.export_changes(output_path)
 
 
@@ -238,6 +276,11 @@ def init():
         shutil.copy(example_path, config_path)
         console.print(f"[green]✓[/green] Created config/config.yaml from example")
     
+    # Create database and its query indexes
+    from src.utils.database import LeadDatabase
+    LeadDatabase().ensure_indexes()
+    console.print(f"[green]✓[/green] Initialized data/leads.db")
+    
     console.print("\n[bold green]Project initialized![/bold green]")
     console.print("\nNext steps:")
     console.print("  1. Edit config/config.yaml with your preferences")
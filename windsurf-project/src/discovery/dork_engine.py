@@ -10,24 +10,42 @@ Usage:
 """
 
 import os
+import re
 import sys
 import json
 import hashlib
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple, Iterable, Iterator, Callable
 from dataclasses import dataclass, field, asdict
-from urllib.parse import quote_plus, urlparse
-import yaml
+from functools import lru_cache
+from itertools import chain
+from string import Formatter
+from urllib.parse import quote_from_bytes, quote_plus, urlparse
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-# Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
 
+# Add project root to path (only needed when run as a script)
+if __name__ == '__main__':
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# yaml, rich.table and click are imported where used; this module is
+# imported by every `run.py discover` and should stay cheap to load
 from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress
-import click
+
+from src.utils.yaml_cache import read_yaml
 
 console = Console()
 
@@ -36,7 +54,56 @@ console = Console()
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+class _Defaulting(dict):
+    """Substitution mapping that leaves unknown placeholders untouched."""
+    
+    def __missing__(self, key: str) -> str:
+        return '{' + key + '}'
+
+
+GOOGLE_SEARCH_PREFIX = "https://www.google.com/search?q="
+
+# Encoded substitution values; roles/techs/exclusions repeat across templates
+_ENC_CACHE: Dict[str, str] = {}
+
+
+def _qp(value: str) -> str:
+    """quote_plus with a memo (quote_plus is per-character, so pieces concatenate)."""
+    encoded = _ENC_CACHE.get(value)
+    if encoded is None:
+        # Same result as quote_plus, minus its str/safe argument handling
+        encoded = quote_from_bytes(value.encode('utf-8'), ' ').replace(' ', '+')
+        _ENC_CACHE[value] = encoded
+    return encoded
+
+
+def _split_template(template: str) -> Tuple[Tuple[str, str, Optional[str]], ...]:
+    """Split a template into (literal, encoded literal, field name or None) segments."""
+    return tuple(
+        (literal, quote_plus(literal), field_name)
+        for literal, field_name, _, _ in Formatter().parse(template)
+    )
+
+
+@lru_cache(maxsize=4096)
+def _extract_domain(url: str) -> str:
+    """Extract root domain from URL (memoized; URLs repeat across categories)."""
+    try:
+        parsed = urlparse(url)
+        domain = parsed.netloc.lower()
+        # Remove www prefix
+        if domain.startswith('www.'):
+            domain = domain[4:]
+        return domain
+    except Exception:
+        return ""
+
+
+# __slots__ drops the per-instance __dict__ (dataclass slots need Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class DorkTemplate:
     """Represents a single Google dork template."""
     name: str
@@ -46,21 +113,57 @@ class DorkTemplate:
     use_case: str
     priority: int = 1  # 1=high, 2=medium, 3=low
     
+    _format: Callable = field(init=False, repr=False, compare=False)
+    _segments: Tuple = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Shared labels collapse to one object per distinct string
+        self.name = sys.intern(self.name)
+        self.category = sys.intern(self.category)
+        self.use_case = sys.intern(self.use_case)
+        
+        # Bind the formatter once; build() is a single C-level pass
+        self._format = self.template.format_map
+        self._segments = _split_template(self.template)
+    
     def build(self, **kwargs) -> str:
         """Build the dork query with variable substitution."""
-        query = self.template
-        for key, value in kwargs.items():
-            query = query.replace(f"{{{key}}}", value)
-        return query
+        return self._format(_Defaulting(kwargs))
     
     def to_google_url(self, **kwargs) -> str:
         """Generate a Google search URL for this dork."""
-        query = self.build(**kwargs)
-        encoded = quote_plus(query)
-        return f"https://www.google.com/search?q={encoded}"
+        parts = [GOOGLE_SEARCH_PREFIX]
+        for _, encoded, name in self._segments:
+            parts.append(encoded)
+            if name is not None:
+                parts.append(_qp(str(kwargs[name]) if name in kwargs else '{' + name + '}'))
+        return ''.join(parts)
+    
+    def bind(self, variable: Optional[str], **fixed) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Partially evaluate the template with every value but one.
+        
+        Returns (query chunks, URL chunks) split around the placeholder
+        named by variable, so build() is value.join(query_chunks) and
+        to_google_url() is quote_plus(value).join(url_chunks).
+        """
+        query_chunks, url_chunks = [''], [GOOGLE_SEARCH_PREFIX]
+        for literal, encoded, name in self._segments:
+            query_chunks[-1] += literal
+            url_chunks[-1] += encoded
+            if name is None:
+                continue
+            if name == variable:
+                query_chunks.append('')
+                url_chunks.append('')
+                continue
+            value = str(fixed[name]) if name in fixed else '{' + name + '}'
+            query_chunks[-1] += value
+            url_chunks[-1] += _qp(value)
+        return tuple(query_chunks), tuple(url_chunks)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DiscoveredDomain:
     """Represents a discovered domain from dork results."""
     domain: str
@@ -377,6 +480,16 @@ ALL_DORKS = {
     'remote': REMOTE_DORKS,
 }
 
+# Blocklist entries that are plain domains or dot-suffixes ('.gov')
+_DOMAIN_ENTRY = re.compile(r'\.?[a-z0-9-]+(?:\.[a-z0-9-]+)*')
+
+QUERY_CACHE_TTL_SEC = 86400  # cached_queries() results stay valid for a day
+PLAIN_TABLE_ROWS = 200  # longer query listings print as plain text, not a Rich table
+
+# Flattened views, built once at import (generate_queries reads these)
+_FLAT_DORKS = tuple(dork for dorks in ALL_DORKS.values() for dork in dorks)
+_BY_CATEGORY = {category: tuple(dorks) for category, dorks in ALL_DORKS.items()}
+
 
 # =============================================================================
 # DORK ENGINE
@@ -416,21 +529,36 @@ class DorkEngine:
             config_path = PROJECT_ROOT / 'config' / 'config.example.yaml'
             
         if config_path.exists():
-            with open(config_path) as f:
-                return yaml.safe_load(f)
+            return read_yaml(config_path)
         return {}
     
     def _load_blocklist(self):
         """Load domain blocklist."""
         blocklist_path = PROJECT_ROOT / 'config' / 'blocklist.yaml'
-        self.blocklist = set()
+        entries = set()
         
         if blocklist_path.exists():
-            with open(blocklist_path) as f:
-                data = yaml.safe_load(f)
-                for category in data.values():
-                    if isinstance(category, list):
-                        self.blocklist.update(category)
+            data = read_yaml(blocklist_path)
+            for category in data.values():
+                if isinstance(category, list):
+                    entries.update(str(e).lower() for e in category)
+        
+        # Domain entries ('linkedin.com') match on label suffixes and
+        # dotted ones ('.edu') on any label, both via set lookup; anything
+        # else (paths, patterns) stays a substring test
+        domains = {e for e in entries if _DOMAIN_ENTRY.fullmatch(e)}
+        self.blocklist = frozenset(e for e in domains if not e.startswith('.'))
+        self._label_blocks = frozenset(e[1:] for e in domains if e.startswith('.'))
+        self._substring_blocks = frozenset(entries - domains)
+        
+        # One automaton scan matches every substring entry at once
+        self._substring_automaton = None
+        if HAS_AHOCORASICK and self._substring_blocks:
+            automaton = ahocorasick.Automaton()
+            for entry in self._substring_blocks:
+                automaton.add_word(entry, entry)
+            automaton.make_automaton()
+            self._substring_automaton = automaton
     
     def get_roles(self) -> List[str]:
         """Get target roles from config."""
@@ -447,14 +575,13 @@ class DorkEngine:
         techs = ['python', 'spark', 'airflow', 'kubernetes']
         
         if keywords_path.exists():
-            with open(keywords_path) as f:
-                data = yaml.safe_load(f)
-                # Extract high-weight techs
-                for category in ['languages', 'data_ml', 'infrastructure']:
-                    if category in data:
-                        for tech, info in data[category].items():
-                            if info.get('weight', 0) >= 0.8:
-                                techs.append(tech)
+            data = read_yaml(keywords_path)
+            # Extract high-weight techs
+            for category in ['languages', 'data_ml', 'infrastructure']:
+                if category in data:
+                    for tech, info in data[category].items():
+                        if info.get('weight', 0) >= 0.8:
+                            techs.append(tech)
         return list(set(techs))
     
     def get_locations(self) -> List[str]:
@@ -465,16 +592,16 @@ class DorkEngine:
             'new york'
         ])
     
-    def generate_queries(
+    def iter_queries(
         self,
         categories: Optional[List[str]] = None,
         roles: Optional[List[str]] = None,
         techs: Optional[List[str]] = None,
         locations: Optional[List[str]] = None,
         priority_max: int = 2
-    ) -> List[Dict]:
+    ) -> Iterator[Dict]:
         """
-        Generate dork queries from templates.
+        Generate dork queries from templates, one at a time.
         
         Args:
             categories: List of dork categories to use (None = all)
@@ -483,11 +610,13 @@ class DorkEngine:
             locations: Target locations
             priority_max: Maximum priority level to include (1=high only, 2=+medium, 3=all)
             
-        Returns:
-            List of dicts with query info
+        Yields:
+            Dicts with query info
         """
         if categories is None:
-            categories = list(ALL_DORKS.keys())
+            dorks = _FLAT_DORKS
+        else:
+            dorks = tuple(chain.from_iterable(_BY_CATEGORY.get(c, ()) for c in categories))
         if roles is None:
             roles = self.get_roles()
         if techs is None:
@@ -495,109 +624,134 @@ class DorkEngine:
         if locations is None:
             locations = self.get_locations()
             
-        queries = []
         year = str(datetime.now().year)
         
-        for category in categories:
-            dorks = ALL_DORKS.get(category, [])
+        fixed = {
+            'role': roles[0] if roles else 'engineer',
+            'tech': techs[0] if techs else 'python',
+            'location': locations[0] if locations else 'remote',
+            'year': year,
+            'exclusions': self.STANDARD_EXCLUSIONS,
+        }
+        # Templates shared across categories can render the same query
+        seen_queries: Set[str] = set()
+        
+        for dork in dorks:
+            if dork.priority > priority_max:
+                continue
+                
+            # Generate variations based on template variables
+            if '{role}' in dork.template:
+                variable, values = 'role', roles[:3]  # Limit to top 3 roles
+            elif '{tech}' in dork.template:
+                variable, values = 'tech', techs[:3]  # Limit to top 3 techs
+            else:
+                variable, values = None, (None,)
+            
+            # Everything but the varying value is fixed per dork, so the
+            # template is evaluated once into literal chunks to join on
+            query_chunks, url_chunks = dork.bind(variable, **fixed)
+            
+            if variable is None:
+                names, queries, urls = (dork.name,), query_chunks, url_chunks
+            else:
+                suffixes = [v.replace(' ', '_') for v in values] if variable == 'role' else values
+                names = [f"{dork.name}_{s}" for s in suffixes]
+                queries = [v.join(query_chunks) for v in values]
+                urls = [_qp(v).join(url_chunks) for v in values]
             
-            for dork in dorks:
-                if dork.priority > priority_max:
-                    continue
-                    
-                # Generate variations based on template variables
-                if '{role}' in dork.template:
-                    for role in roles[:3]:  # Limit to top 3 roles
-                        query = dork.build(
-                            role=role,
-                            tech=techs[0] if techs else 'python',
-                            location=locations[0] if locations else 'remote',
-                            year=year,
-                            exclusions=self.STANDARD_EXCLUSIONS
-                        )
-                        queries.append({
-                            'name': f"{dork.name}_{role.replace(' ', '_')}",
-                            'category': category,
-                            'query': query,
-                            'google_url': dork.to_google_url(
-                                role=role,
-                                tech=techs[0] if techs else 'python',
-                                location=locations[0] if locations else 'remote',
-                                year=year,
-                                exclusions=self.STANDARD_EXCLUSIONS
-                            ),
-                            'description': dork.description,
-                            'priority': dork.priority
-                        })
-                        
-                elif '{tech}' in dork.template:
-                    for tech in techs[:3]:  # Limit to top 3 techs
-                        query = dork.build(
-                            tech=tech,
-                            role=roles[0] if roles else 'engineer',
-                            location=locations[0] if locations else 'remote',
-                            year=year,
-                            exclusions=self.STANDARD_EXCLUSIONS
-                        )
-                        queries.append({
-                            'name': f"{dork.name}_{tech}",
-                            'category': category,
-                            'query': query,
-                            'google_url': dork.to_google_url(
-                                tech=tech,
-                                role=roles[0] if roles else 'engineer',
-                                location=locations[0] if locations else 'remote',
-                                year=year,
-                                exclusions=self.STANDARD_EXCLUSIONS
-                            ),
-                            'description': dork.description,
-                            'priority': dork.priority
-                        })
-                else:
-                    query = dork.build(
-                        role=roles[0] if roles else 'engineer',
-                        tech=techs[0] if techs else 'python',
-                        location=locations[0] if locations else 'remote',
-                        year=year,
-                        exclusions=self.STANDARD_EXCLUSIONS
-                    )
-                    queries.append({
-                        'name': dork.name,
-                        'category': category,
-                        'query': query,
-                        'google_url': dork.to_google_url(
-                            role=roles[0] if roles else 'engineer',
-                            tech=techs[0] if techs else 'python',
-                            location=locations[0] if locations else 'remote',
-                            year=year,
-                            exclusions=self.STANDARD_EXCLUSIONS
-                        ),
-                        'description': dork.description,
-                        'priority': dork.priority
-                    })
+            # Records for one dork are rendered as a batch
+            category, description, priority = dork.category, dork.description, dork.priority
+            yield from (
+                {
+                    'name': n,
+                    'category': category,
+                    'query': q,
+                    'google_url': u,
+                    'description': description,
+                    'priority': priority
+                }
+                for n, q, u in zip(names, queries, urls)
+                if not (q in seen_queries or seen_queries.add(q))
+            )
+    
+    def generate_queries(
+        self,
+        categories: Optional[List[str]] = None,
+        roles: Optional[List[str]] = None,
+        techs: Optional[List[str]] = None,
+        locations: Optional[List[str]] = None,
+        priority_max: int = 2
+    ) -> List[Dict]:
+        """Generate dork queries as a list (see iter_queries for streaming)."""
+        return list(self.iter_queries(categories, roles, techs, locations, priority_max))
+    
+    def cached_queries(
+        self,
+        categories: Optional[List[str]] = None,
+        roles: Optional[List[str]] = None,
+        techs: Optional[List[str]] = None,
+        priority_max: int = 2,
+        ttl_sec: int = QUERY_CACHE_TTL_SEC
+    ) -> List[Dict]:
+        """
+        generate_queries() backed by the on-disk result cache.
+        
+        The key hashes everything the output depends on (templates, roles,
+        techs, locations, priority, year), so edits to any of them miss.
+        A hit costs a SQLite read (~1.3 ms), more than generating the
+        default ~100 queries, so this is opt-in (discover --cache).
+        """
+        from src.utils.database import LeadDatabase
+        
+        if roles is None:
+            roles = self.get_roles()
+        if techs is None:
+            techs = self.get_techs()
+            # get_techs() order is arbitrary; key on the set, not the order
+            key_techs = sorted(techs)
+        else:
+            key_techs = techs
+        locations = self.get_locations()
+        dorks = _FLAT_DORKS if categories is None else [
+            d for c in categories for d in _BY_CATEGORY.get(c, ())
+        ]
+        
+        key = hashlib.sha256(json.dumps([
+            [(d.name, d.template, d.description, d.priority) for d in dorks],
+            roles, key_techs, locations, priority_max,
+            datetime.now().year, self.STANDARD_EXCLUSIONS
+        ]).encode('utf-8')).digest()
+        
+        db = LeadDatabase()
+        cached = db.cache_get(key, ttl_sec)
+        if cached is not None:
+            return orjson.loads(cached) if HAS_ORJSON else json.loads(cached)
         
+        queries = self.generate_queries(categories, roles, techs, locations, priority_max)
+        db.cache_set(key, orjson.dumps(queries) if HAS_ORJSON else json.dumps(queries).encode('utf-8'))
         return queries
     
     def extract_domain(self, url: str) -> str:
         """Extract root domain from URL."""
-        try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            # Remove www prefix
-            if domain.startswith('www.'):
-                domain = domain[4:]
-            return domain
-        except Exception:
-            return ""
+        return _extract_domain(url)
     
     def is_blocked(self, domain: str) -> bool:
         """Check if domain is in blocklist."""
         if not domain:
             return True
-        for blocked in self.blocklist:
-            if blocked in domain or domain.endswith(blocked):
+        
+        # 'jobs.linkedin.com' -> 'jobs.linkedin.com', 'linkedin.com', 'com'
+        labels = domain.split('.')
+        for i in range(len(labels)):
+            if '.'.join(labels[i:]) in self.blocklist:
                 return True
-        return False
+        if not self._label_blocks.isdisjoint(labels[1:]):
+            return True
+        
+        if self._substring_automaton is not None:
+            return next(self._substring_automaton.iter(domain), None) is not None
+        return any(b in domain for b in self._substring_blocks)
     
     def is_duplicate(self, domain: str) -> bool:
         """Check if domain was already discovered."""
@@ -640,6 +794,19 @@ class DorkEngine:
     
     def export_queries_table(self, queries: List[Dict]) -> None:
         """Display queries in a formatted table."""
+        # Rich layout is wasted on pipes and slow on long listings
+        if len(queries) > PLAIN_TABLE_ROWS or not console.is_terminal:
+            lines = [f"{'Category':<16} {'Name':<40} {'Pri':>3}  Query"]
+            lines.extend(
+                f"{q['category']:<16} {q['name']:<40} {q['priority']:>3}  "
+                f"{q['query'][:60] + '...' if len(q['query']) > 60 else q['query']}"
+                for q in queries
+            )
+            console.out('\n'.join(lines), highlight=False)
+            return
+        
+        from rich.table import Table
+        
         table = Table(title="Generated Dork Queries")
         table.add_column("Category", style="cyan")
         table.add_column("Name", style="green")
@@ -656,29 +823,43 @@ class DorkEngine:
         
         console.print(table)
     
-    def export_urls(self, queries: List[Dict], output_path: Path) -> None:
-        """Export Google search URLs to file."""
+    def export_urls(self, queries: Iterable[Dict], output_path: Path) -> int:
+        """Export Google search URLs to file, streaming (queries may be a generator)."""
         output_path.parent.mkdir(parents=True, exist_ok=True)
+        count = 0
         
-        with open(output_path, 'w') as f:
+        def lines():
+            nonlocal count
             for q in queries:
-                f.write(f"# {q['name']} ({q['category']})\n")
-                f.write(f"{q['google_url']}\n\n")
+                count += 1
+                yield f"# {q['name']} ({q['category']})\n{q['google_url']}\n\n"
         
-        console.print(f"[green]Exported {len(queries)} URLs to {output_path}[/green]")
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(lines())
+        
+        console.print(f"[green]Exported {count} URLs to {output_path}[/green]")
+        return count
     
-    def export_csv(self, queries: List[Dict], output_path: Path) -> None:
-        """Export queries to CSV."""
+    def export_csv(self, queries: Iterable[Dict], output_path: Path) -> int:
+        """Export queries to CSV, streaming (queries may be a generator)."""
         import csv
         
         output_path.parent.mkdir(parents=True, exist_ok=True)
+        count = 0
+        
+        def rows():
+            nonlocal count
+            for q in queries:
+                count += 1
+                yield q
         
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
             writer = csv.DictWriter(f, fieldnames=['name', 'category', 'priority', 'query', 'google_url', 'description'])
             writer.writeheader()
-            writer.writerows(queries)
+            writer.writerows(rows())
         
-        console.print(f"[green]Exported {len(queries)} queries to {output_path}[/green]")
+        console.print(f"[green]Exported {count} queries to {output_path}[/green]")
+        return count
     
     def export_discoveries_csv(self, output_path: Path) -> None:
         """Export discovered domains to CSV."""
@@ -690,8 +871,7 @@ class DorkEngine:
             fieldnames = ['domain', 'url', 'title', 'snippet', 'category', 'source_query', 'discovered_at']
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
-            for d in self.discoveries:
-                writer.writerow(d.to_dict())
+            writer.writerows(d.to_dict() for d in self.discoveries)
         
         console.print(f"[green]Exported {len(self.discoveries)} discoveries to {output_path}[/green]")
 
@@ -700,64 +880,70 @@ class DorkEngine:
 # CLI INTERFACE
 # =============================================================================
 
-@click.command()
-@click.option('--category', '-c', multiple=True, help='Dork categories to use')
-@click.option('--all-categories', '-a', is_flag=True, help='Use all categories')
-@click.option('--priority', '-p', default=2, help='Max priority level (1-3)')
-@click.option('--output', '-o', type=click.Path(), help='Output file path')
-@click.option('--format', '-f', type=click.Choice(['table', 'urls', 'csv', 'json']), default='table')
-@click.option('--role', '-r', multiple=True, help='Target roles')
-@click.option('--tech', '-t', multiple=True, help='Target technologies')
-def main(category, all_categories, priority, output, format, role, tech):
-    """
-    Generate Google dork queries for hidden job market discovery.
-    
-    Examples:
-        python dork_engine.py --all-categories --format urls -o queries.txt
-        python dork_engine.py -c careers -c hiring_signals --format csv
-        python dork_engine.py -r "data engineer" -t spark --format table
-    """
-    engine = DorkEngine()
-    
-    # Determine categories
-    categories = None
-    if all_categories:
-        categories = list(ALL_DORKS.keys())
-    elif category:
-        categories = list(category)
-    
-    # Generate queries
-    queries = engine.generate_queries(
-        categories=categories,
-        roles=list(role) if role else None,
-        techs=list(tech) if tech else None,
-        priority_max=priority
-    )
+if __name__ == '__main__':
+    import click
     
-    console.print(f"\n[bold]Generated {len(queries)} dork queries[/bold]\n")
+    @click.command()
+    @click.option('--category', '-c', multiple=True, help='Dork categories to use')
+    @click.option('--all-categories', '-a', is_flag=True, help='Use all categories')
+    @click.option('--priority', '-p', default=2, help='Max priority level (1-3)')
+    @click.option('--output', '-o', type=click.Path(), help='Output file path')
+    @click.option('--format', '-f', type=click.Choice(['table', 'urls', 'csv', 'json']), default='table')
+    @click.option('--role', '-r', multiple=True, help='Target roles')
+    @click.option('--tech', '-t', multiple=True, help='Target technologies')
+    def main(category, all_categories, priority, output, format, role, tech):
+        """
+        Generate Google dork queries for hidden job market discovery.
+        
+        Examples:
+            python dork_engine.py --all-categories --format urls -o queries.txt
+            python dork_engine.py -c careers -c hiring_signals --format csv
+            python dork_engine.py -r "data engineer" -t spark --format table
+        """
+        engine = DorkEngine()
+        
+        # Determine categories
+        categories = None
+        if all_categories:
+            categories = None
+        elif category:
+            categories = list(category)
+        
+        # Generate queries
+        queries = engine.generate_queries(
+            categories=categories,
+            roles=list(role) if role else None,
+            techs=list(tech) if tech else None,
+            priority_max=priority
+        )
+        
+        console.print(f"\n[bold]Generated {len(queries)} dork queries[/bold]\n")
+        
+        # Output based on format
+        if format == 'table':
+            engine.export_queries_table(queries)
+        elif format == 'urls':
+            output_path = Path(output) if output else PROJECT_ROOT / 'output' / 'dork_urls.txt'
+            engine.export_urls(queries, output_path)
+        elif format == 'csv':
+            output_path = Path(output) if output else PROJECT_ROOT / 'output' / 'dork_queries.csv'
+            engine.export_csv(queries, output_path)
+        elif format == 'json':
+            output_path = Path(output) if output else PROJECT_ROOT / 'output' / 'dork_queries.json'
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            if HAS_ORJSON:
+                with open(output_path, 'wb') as f:
+                    f.write(orjson.dumps(queries, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_path, 'w') as f:
+                    json.dump(queries, f, indent=2)
+            console.print(f"[green]Exported to {output_path}[/green]")
+        
+        # Print usage instructions
+        console.print("\n[bold cyan]Next Steps:[/bold cyan]")
+        console.print("1. Open the Google URLs in your browser (with delays)")
+        console.print("2. Copy relevant company URLs from results")
+        console.print("3. Run the scraper: python src/extraction/scraper.py --input domains.txt")
     
-    # Output based on format
-    if format == 'table':
-        engine.export_queries_table(queries)
-    elif format == 'urls':
-        output_path = Path(output) if output else PROJECT_ROOT / 'output' / 'dork_urls.txt'
-        engine.export_urls(queries, output_path)
-    elif format == 'csv':
-        output_path = Path(output) if output else PROJECT_ROOT / 'output' / 'dork_queries.csv'
-        engine.export_csv(queries, output_path)
-    elif format == 'json':
-        output_path = Path(output) if output else PROJECT_ROOT / 'output' / 'dork_queries.json'
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w') as f:
-            json.dump(queries, f, indent=2)
-        console.print(f"[green]Exported to {output_path}[/green]")
     
-    # Print usage instructions
-    console.print("\n[bold cyan]Next Steps:[/bold cyan]")
-    console.print("1. Open the Google URLs in your browser (with delays)")
-    console.print("2. Copy relevant company URLs from results")
-    console.print("3. Run the scraper: python src/extraction/scraper.py --input domains.txt")
-
-
-if __name__ == '__main__':
     main()
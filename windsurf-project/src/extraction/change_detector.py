@@ -14,26 +14,41 @@ Usage:
 
 import sys
 import json
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Iterable, Iterator, Optional, Set, Tuple
 from dataclasses import dataclass
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.extraction.scraper import JobMarketScraper, ScrapedPage
+from src.extraction.scraper import JobMarketScraper, ScrapedPage, content_hash_algorithm
 from src.utils.database import LeadDatabase
+from src.utils.domain_list import iter_domains
 
 from rich.console import Console
-from rich.table import Table
 import click
 
 console = Console()
 
+# __slots__ drops the per-instance __dict__ (dataclass slots need Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Above this many rows (or off a terminal) tables print as plain text
+PLAIN_TABLE_ROWS = 200
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Change:
     """Represents a detected change."""
     domain: str
@@ -67,11 +82,27 @@ class ChangeDetector:
     """
     
     SIGNIFICANT_SCORE_CHANGE = 10  # Points
+    MAX_WORKERS = 16  # Domains checked concurrently
     
-    def __init__(self, db: Optional[LeadDatabase] = None):
+    def __init__(self, db: Optional[LeadDatabase] = None, max_workers: int = MAX_WORKERS):
         self.db = db or LeadDatabase()
         self.scraper = JobMarketScraper()
+        self.max_workers = max_workers
         self.changes: List[Change] = []
+        
+        # Worker threads each get their own scraper (its requests.Session
+        # and result lists aren't thread-safe); this thread uses self.scraper
+        self._local = threading.local()
+        self._local.scraper = self.scraper
+    
+    def _thread_scraper(self) -> JobMarketScraper:
+        """The calling thread's scraper, sharing self.scraper's rate limiter."""
+        scraper = getattr(self._local, 'scraper', None)
+        if scraper is None:
+            scraper = JobMarketScraper()
+            scraper.rate_limiter = self.scraper.rate_limiter
+            self._local.scraper = scraper
+        return scraper
     
     def detect_page_changes(self, url: str) -> List[Change]:
         """
@@ -87,29 +118,39 @@ class ChangeDetector:
             return changes
         
         # Scrape current state
-        current = self.scraper.scrape_page(url)
+        current = self._thread_scraper().scrape_page(url)
         if not current:
             return changes
         
         domain = current.domain
         
-        # Check content hash
-        if stored.get('content_hash') != current.content_hash:
+        # Same HTML hash means titles and signals extract identically,
+        # so the common no-change poll skips the diffs below
+        stored_hash = stored.get('content_hash')
+        if stored_hash == current.content_hash:
+            return changes
+        
+        # Content hash changed (a hash stored by an install with different
+        # extras, xxh3 vs MD5, can't be compared: only the diffs below run)
+        if content_hash_algorithm(stored_hash) == content_hash_algorithm(current.content_hash):
             changes.append(Change(
                 domain=domain,
                 url=url,
                 change_type='content_change',
-                old_value=stored.get('content_hash'),
+                old_value=stored_hash,
                 new_value=current.content_hash,
                 detected_at=datetime.now()
             ))
         
-        # Check job titles
-        old_titles = set(stored.get('job_titles', []))
-        new_titles = set(current.job_titles)
+        # Check job titles (interned, so equal titles on both sides are
+        # the same object and set lookups resolve on identity)
+        old_titles = set(map(sys.intern, stored.get('job_titles') or ()))
+        new_titles = set(map(sys.intern, current.job_titles))
         
-        added_titles = new_titles - old_titles
-        removed_titles = old_titles - new_titles
+        # One pass over the symmetric difference classifies both sides
+        added_titles, removed_titles = [], []
+        for title in new_titles ^ old_titles:
+            (added_titles if title in new_titles else removed_titles).append(title)
         
         for title in added_titles:
             changes.append(Change(
@@ -132,10 +173,7 @@ class ChangeDetector:
             ))
         
         # Check hiring signals
-        old_signals = set(stored.get('hiring_signals', []))
-        new_signals = set(current.hiring_signals)
-        
-        added_signals = new_signals - old_signals
+        added_signals = set(current.hiring_signals).difference(stored.get('hiring_signals') or ())
         for signal in added_signals:
             changes.append(Change(
                 domain=domain,
@@ -188,31 +226,52 @@ class ChangeDetector:
         
         return None
     
-    def run_detection(self, domains: List[str]) -> List[Change]:
-        """Run change detection on a list of domains."""
+    def _check_domain(self, domain: str) -> Tuple[List[Change], Optional[Change]]:
+        """Detect page and score changes for one domain."""
+        console.print(f"[cyan]Checking {domain}...[/cyan]")
+        return self.detect_domain_changes(domain), self.detect_score_changes(domain)
+    
+    def _check_domains(
+        self,
+        executor: ThreadPoolExecutor,
+        domains: Iterable[str]
+    ) -> Iterator[Tuple[List[Change], Optional[Change]]]:
+        """
+        _check_domain over domains in input order, consuming the iterable
+        lazily: at most 2 * max_workers domains are in flight at a time.
+        """
+        pending = deque()
+        for domain in domains:
+            pending.append(executor.submit(self._check_domain, domain))
+            if len(pending) >= 2 * self.max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    
+    def run_detection(self, domains: Iterable[str]) -> List[Change]:
+        """
+        Run change detection on domains (any iterable, read as it goes).
+        
+        Domains are checked on a thread pool so page fetches overlap (the
+        shared rate limiter paces each domain separately); results keep
+        the input domain order.
+        """
         all_changes = []
+        page_changes = []
         
-        for domain in domains:
-            console.print(f"[cyan]Checking {domain}...[/cyan]")
-            
-            # Page changes
-            domain_changes = self.detect_domain_changes(domain)
-            all_changes.extend(domain_changes)
-            
-            # Score changes
-            score_change = self.detect_score_changes(domain)
-            if score_change:
-                all_changes.append(score_change)
-            
-            # Log to database
-            for change in domain_changes:
-                self.db.log_change(
-                    domain=change.domain,
-                    change_type=change.change_type,
-                    old_value=change.old_value,
-                    new_value=change.new_value,
-                    url=change.url
-                )
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for domain_changes, score_change in self._check_domains(executor, domains):
+                all_changes.extend(domain_changes)
+                page_changes.extend(domain_changes)
+                if score_change:
+                    all_changes.append(score_change)
+        
+        # Log page changes to database in one transaction
+        if page_changes:
+            self.db.log_changes_bulk(
+                (c.domain, c.url, c.change_type, c.old_value, c.new_value)
+                for c in page_changes
+            )
         
         self.changes = all_changes
         return all_changes
@@ -223,6 +282,12 @@ class ChangeDetector:
             console.print("[green]No changes detected.[/green]")
             return
         
+        if len(changes) > PLAIN_TABLE_ROWS or not console.is_terminal:
+            self._display_changes_plain(changes)
+            return
+        
+        from rich.table import Table
+        
         table = Table(title=f"Detected Changes ({len(changes)})")
         table.add_column("Domain", style="cyan")
         table.add_column("Type", style="yellow")
@@ -247,12 +312,28 @@ class ChangeDetector:
         
         console.print(table)
     
+    def _display_changes_plain(self, changes: List[Change]):
+        """Print changes as plain fixed-width text, built in one join."""
+        lines = [f"Detected Changes ({len(changes)})", f"{'Domain':<32} {'Type':<16} {'Old Value':<30} New Value"]
+        lines.extend(
+            f"{c.domain:<32} {c.change_type:<16} "
+            f"{str(c.old_value)[:30] if c.old_value else '-':<30} "
+            f"{str(c.new_value)[:30] if c.new_value else '-'}"
+            for c in changes
+        )
+        console.out('\n'.join(lines), highlight=False)
+    
     def export_changes(self, output_path: Path):
         """Export changes to JSON."""
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w') as f:
-            json.dump([c.to_dict() for c in self.changes], f, indent=2)
+        if HAS_ORJSON:
+            # Serializes the Change dataclasses and datetimes natively
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(self.changes, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w') as f:
+                json.dump([c.to_dict() for c in self.changes], f, indent=2)
         
         console.print(f"[green]Exported {len(self.changes)} changes to {output_path}[/green]")
 
@@ -284,9 +365,9 @@ def main(domains, all_high_priority, output):
         console.print(f"[cyan]Checking {len(domain_list)} high-priority domains...[/cyan]")
     
     elif domains:
-        with open(domains) as f:
-            domain_list = [line.strip() for line in f if line.strip()]
-        console.print(f"[cyan]Checking {len(domain_list)} domains from file...[/cyan]")
+        # Streamed: the file is read as domains are checked
+        domain_list = iter_domains(domains)
+        console.print(f"[cyan]Checking domains from {domains}...[/cyan]")
     
     else:
         console.print("[red]Please provide --domains or --all-high-priority[/red]")
@@ -6,20 +6,118 @@ Caches results to minimize repeated requests.
 """
 
 import re
+import json
+import asyncio
+import hashlib
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse, urljoin
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# robots.txt bodies persist here between runs, one JSON file per domain
+ROBOTS_CACHE_DIR = Path(__file__).parent.parent.parent / 'data' / 'robots'
+
+
+@lru_cache(maxsize=4096)
+def _split_url(url: str) -> Tuple[str, str, str]:
+    """(domain, robots.txt URL, path) for a URL; one memoized urlparse."""
+    parsed = urlparse(url)
+    return (
+        parsed.netloc.lower(),
+        f"{parsed.scheme}://{parsed.netloc}/robots.txt",
+        parsed.path or '/',
+    )
+
+
+@lru_cache(maxsize=4096)
+def _compile_robots_pattern(pattern: str) -> Optional['re.Pattern']:
+    """
+    Compile a robots.txt path pattern to a regex (None if it never matches).
+    
+    * matches any sequence; a trailing $ anchors the end of the path
+    (elsewhere $ is literal). The result is meant for .match(), which
+    anchors the start, so no trailing .* is needed. Memoized, since the
+    same patterns recur across sites.
+    """
+    if not pattern:
+        return None
+    
+    anchored = pattern.endswith('$')
+    if anchored:
+        pattern = pattern[:-1]
+    
+    parts = []
+    for ch in pattern:
+        if ch != '*':
+            parts.append(re.escape(ch))
+        elif not parts or parts[-1] != '.*':
+            # Runs of * collapse into one .* to avoid stacked backtracking
+            parts.append('.*')
+    
+    if anchored:
+        parts.append(r'\Z')
+    
+    return re.compile(''.join(parts))
 
 
 @dataclass
 class RobotsRule:
     """Represents a parsed robots.txt rule."""
     user_agent: str
-    allowed_paths: list
-    disallowed_paths: list
+    allowed_paths: tuple
+    disallowed_paths: tuple
     crawl_delay: Optional[float] = None
+    
+    # Built once at parse time: rules bucketed by pattern length, longest
+    # first, as (length, allow prefixes, disallow prefixes, wildcard rules)
+    levels: list = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        buckets: Dict[int, tuple] = {}
+        for paths, is_allow in ((self.allowed_paths, True), (self.disallowed_paths, False)):
+            for pattern in paths:
+                if not pattern:
+                    continue
+                allow_set, disallow_set, wildcards = buckets.setdefault(len(pattern), (set(), set(), []))
+                if '*' in pattern or pattern.endswith('$'):
+                    wildcards.append((_compile_robots_pattern(pattern), is_allow))
+                else:
+                    (allow_set if is_allow else disallow_set).add(pattern)
+        
+        self.levels = [
+            (length, frozenset(allow_set), frozenset(disallow_set),
+             sorted(wildcards, key=lambda w: not w[1]))
+            for length, (allow_set, disallow_set, wildcards) in sorted(buckets.items(), reverse=True)
+        ]
+    
+    def match(self, path: str) -> Optional[bool]:
+        """
+        Verdict of the most specific (longest) matching rule, Allow winning
+        ties as RFC 9309 specifies; None when no rule matches.
+        
+        Plain prefixes cost one slice and set lookup per distinct length;
+        only * and $ rules run a regex.
+        """
+        for length, allow_set, disallow_set, wildcards in self.levels:
+            head = path[:length]
+            if head in allow_set:
+                return True
+            for regex, is_allow in wildcards:
+                if is_allow and regex.match(path):
+                    return True
+            if head in disallow_set:
+                return False
+            for regex, is_allow in wildcards:
+                if not is_allow and regex.match(path):
+                    return False
+        return None
 
 
 @dataclass
@@ -29,6 +127,8 @@ class RobotsCache:
     fetched_at: datetime
     raw_content: str
     status_code: int
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
 
 
 class RobotsChecker:
@@ -36,7 +136,9 @@ class RobotsChecker:
     Checks robots.txt compliance before scraping.
     
     Features:
-    - Caches robots.txt per domain
+    - Caches robots.txt per domain, in memory and on disk
+    - Caches failed fetches (network errors, 5xx) for a shorter time
+    - Revalidates stale entries with conditional GETs (ETag / Last-Modified)
     - Supports wildcard matching
     - Extracts crawl-delay directives
     - Handles missing/invalid robots.txt gracefully
@@ -44,43 +146,134 @@ class RobotsChecker:
     
     USER_AGENT = "HiddenJobMarketBot"
     CACHE_DURATION_HOURS = 24
+    ERROR_CACHE_HOURS = 1
     
-    def __init__(self, user_agent: str = None, cache_hours: int = 24):
+    def __init__(
+        self,
+        user_agent: str = None,
+        cache_hours: float = 24,
+        cache_dir: Optional[Path] = ROBOTS_CACHE_DIR,
+        error_cache_hours: float = ERROR_CACHE_HOURS
+    ):
         self.user_agent = user_agent or self.USER_AGENT
         self.cache_hours = cache_hours
+        self.error_cache_hours = error_cache_hours
+        self.cache_dir = cache_dir  # None disables the disk cache
         self._cache: Dict[str, RobotsCache] = {}
+        
+        # One pooled session: keep-alive connections are reused across
+        # fetches, and transient connection failures are retried
+        self._session = requests.Session()
+        self._session.headers['User-Agent'] = self.user_agent
+        adapter = HTTPAdapter(
+            pool_connections=64,
+            pool_maxsize=64,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        
+        # One in-flight async fetch per domain (locks belong to one event loop)
+        self._alocks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._alocks_loop = None
     
     def _get_robots_url(self, url: str) -> str:
         """Get the robots.txt URL for a given URL."""
-        parsed = urlparse(url)
-        return f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+        return _split_url(url)[1]
     
     def _get_domain(self, url: str) -> str:
         """Extract domain from URL."""
-        parsed = urlparse(url)
-        return parsed.netloc.lower()
+        return _split_url(url)[0]
     
-    def _fetch_robots(self, url: str, timeout: int = 10) -> Tuple[str, int]:
-        """Fetch robots.txt content."""
+    def _fetch_robots(
+        self,
+        url: str,
+        timeout: int = 10,
+        stale: Optional[RobotsCache] = None
+    ) -> Tuple[str, int, Optional[str], Optional[str]]:
+        """
+        Fetch robots.txt content.
+        
+        With a stale cache entry the request is conditional, and an
+        unchanged file comes back as a bodiless 304.
+        
+        Returns:
+            Tuple of (content, status_code, etag, last_modified)
+        """
         robots_url = self._get_robots_url(url)
+        headers = self._conditional_headers(stale)
         
         try:
-            response = requests.get(
-                robots_url,
-                timeout=timeout,
-                headers={'User-Agent': self.user_agent}
+            response = self._session.get(robots_url, timeout=timeout, headers=headers)
+            return (
+                response.text,
+                response.status_code,
+                response.headers.get('ETag'),
+                response.headers.get('Last-Modified')
             )
-            return response.text, response.status_code
         except requests.RequestException:
-            return "", 0
+            return "", 0, None, None
+    
+    def _conditional_headers(self, stale: Optional[RobotsCache]) -> Dict[str, str]:
+        """Revalidation headers for a stale cache entry."""
+        headers = {}
+        if stale is not None:
+            if stale.etag:
+                headers['If-None-Match'] = stale.etag
+            if stale.last_modified:
+                headers['If-Modified-Since'] = stale.last_modified
+        return headers
+    
+    async def _afetch_robots(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        timeout: int = 10,
+        stale: Optional[RobotsCache] = None
+    ) -> Tuple[str, int, Optional[str], Optional[str]]:
+        """Async counterpart of _fetch_robots over a shared aiohttp session."""
+        headers = self._conditional_headers(stale)
+        headers['User-Agent'] = self.user_agent
+        
+        try:
+            async with session.get(
+                self._get_robots_url(url),
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as response:
+                return (
+                    await response.text(errors='replace'),
+                    response.status,
+                    response.headers.get('ETag'),
+                    response.headers.get('Last-Modified')
+                )
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return "", 0, None, None
     
     def _parse_robots(self, content: str) -> Dict[str, RobotsRule]:
-        """Parse robots.txt content into rules."""
+        """
+        Parse robots.txt content into rules.
+        
+        Consecutive User-agent lines form one group that shares the rules
+        that follow; each group's path lists are built once and shared
+        by its agents.
+        """
         rules = {}
-        current_agents = []
-        current_allowed = []
-        current_disallowed = []
-        current_delay = None
+        agents = []
+        allowed = []
+        disallowed = []
+        delay = None
+        in_rules = False  # Seen a rule line since the last User-agent
+        
+        def flush():
+            allowed_paths, disallowed_paths = tuple(allowed), tuple(disallowed)
+            for agent in agents:
+                rules[agent.lower()] = RobotsRule(
+                    user_agent=agent,
+                    allowed_paths=allowed_paths,
+                    disallowed_paths=disallowed_paths,
+                    crawl_delay=delay
+                )
         
         for line in content.split('\n'):
             line = line.strip()
@@ -90,49 +283,37 @@ class RobotsChecker:
                 continue
             
             # Parse directive
-            if ':' in line:
-                directive, value = line.split(':', 1)
-                directive = directive.strip().lower()
-                value = value.strip()
+            directive, sep, value = line.partition(':')
+            if not sep:
+                continue
+            directive = directive.strip().lower()
+            value = value.strip()
+            
+            if directive == 'user-agent':
+                # A User-agent after rules starts a new group
+                if in_rules:
+                    flush()
+                    agents, allowed, disallowed, delay = [], [], [], None
+                    in_rules = False
+                agents.append(value)
                 
-                if directive == 'user-agent':
-                    # Save previous agent rules
-                    if current_agents:
-                        for agent in current_agents:
-                            rules[agent.lower()] = RobotsRule(
-                                user_agent=agent,
-                                allowed_paths=current_allowed.copy(),
-                                disallowed_paths=current_disallowed.copy(),
-                                crawl_delay=current_delay
-                            )
-                    
-                    # Start new agent
-                    current_agents = [value]
-                    current_allowed = []
-                    current_disallowed = []
-                    current_delay = None
-                    
-                elif directive == 'allow':
-                    current_allowed.append(value)
-                    
-                elif directive == 'disallow':
-                    current_disallowed.append(value)
-                    
-                elif directive == 'crawl-delay':
-                    try:
-                        current_delay = float(value)
-                    except ValueError:
-                        pass
-        
-        # Save last agent rules
-        if current_agents:
-            for agent in current_agents:
-                rules[agent.lower()] = RobotsRule(
-                    user_agent=agent,
-                    allowed_paths=current_allowed.copy(),
-                    disallowed_paths=current_disallowed.copy(),
-                    crawl_delay=current_delay
-                )
+            elif directive == 'allow':
+                allowed.append(value)
+                in_rules = True
+                
+            elif directive == 'disallow':
+                disallowed.append(value)
+                in_rules = True
+                
+            elif directive == 'crawl-delay':
+                try:
+                    delay = float(value)
+                except ValueError:
+                    pass
+                in_rules = True
+        
+        # Save last group
+        flush()
         
         return rules
     
@@ -141,49 +322,134 @@ class RobotsChecker:
         if domain not in self._cache:
             return False
         
-        cache = self._cache[domain]
-        age = datetime.now() - cache.fetched_at
-        return age < timedelta(hours=self.cache_hours)
+        return self._is_fresh(self._cache[domain])
     
-    def _match_path(self, pattern: str, path: str) -> bool:
-        """Check if a path matches a robots.txt pattern."""
-        if not pattern:
-            return False
+    def _is_fresh(self, cache: RobotsCache) -> bool:
+        """
+        Check if a cache entry is younger than cache_hours.
         
-        # Convert robots.txt pattern to regex
-        # * matches any sequence, $ matches end of URL
-        regex_pattern = re.escape(pattern)
-        regex_pattern = regex_pattern.replace(r'\*', '.*')
-        regex_pattern = regex_pattern.replace(r'\$', '$')
+        Failed fetches (network error or 5xx) only last error_cache_hours,
+        so one outage doesn't leave a domain unchecked for a whole day
+        while every URL on it still skips the refetch in the meantime.
+        """
+        failed = cache.status_code == 0 or cache.status_code >= 500
+        hours = self.error_cache_hours if failed else self.cache_hours
+        return datetime.now() - cache.fetched_at < timedelta(hours=hours)
+    
+    def _disk_path(self, domain: str) -> Path:
+        """Disk cache file for a domain."""
+        return self.cache_dir / f"{hashlib.sha1(domain.encode('utf-8')).hexdigest()}.json"
+    
+    def _load_disk(self, domain: str) -> Optional[RobotsCache]:
+        """Load a domain's cache entry from disk (rules are re-parsed)."""
+        if self.cache_dir is None:
+            return None
         
-        if not regex_pattern.endswith('$'):
-            regex_pattern += '.*'
+        try:
+            data = json.loads(self._disk_path(domain).read_text(encoding='utf-8'))
+            content = data['raw_content']
+            return RobotsCache(
+                rules=self._parse_robots(content) if content else {},
+                fetched_at=datetime.fromisoformat(data['fetched_at']),
+                raw_content=content,
+                status_code=data['status_code'],
+                etag=data.get('etag'),
+                last_modified=data.get('last_modified')
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def _save_disk(self, domain: str, cache: RobotsCache):
+        """Write a domain's cache entry to disk."""
+        # Network errors are retried next run rather than persisted
+        if self.cache_dir is None or cache.status_code == 0:
+            return
         
         try:
-            return bool(re.match(regex_pattern, path))
-        except re.error:
-            return False
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._disk_path(domain).write_text(json.dumps({
+                'fetched_at': cache.fetched_at.isoformat(),
+                'raw_content': cache.raw_content,
+                'status_code': cache.status_code,
+                'etag': cache.etag,
+                'last_modified': cache.last_modified
+            }), encoding='utf-8')
+        except OSError:
+            pass
+    
+    def _match_path(self, pattern: str, path: str) -> bool:
+        """Check if a path matches a robots.txt pattern."""
+        regex = _compile_robots_pattern(pattern)
+        return bool(regex and regex.match(path))
+    
+    def _lookup(self, domain: str) -> Tuple[Optional[RobotsCache], Optional[RobotsCache]]:
+        """Return (fresh entry, stale entry) for a domain from memory or disk."""
+        # Check cache
+        if self._is_cache_valid(domain):
+            return self._cache[domain], None
+        
+        # Fall back to the copy from a previous run
+        stale = self._cache.get(domain) or self._load_disk(domain)
+        if stale is not None and self._is_fresh(stale):
+            self._cache[domain] = stale
+            return stale, None
+        return None, stale
     
     def get_rules(self, url: str) -> Optional[RobotsCache]:
         """Get robots.txt rules for a URL, fetching if needed."""
         domain = self._get_domain(url)
+        cache, stale = self._lookup(domain)
+        if cache is not None:
+            return cache
         
-        # Check cache
-        if self._is_cache_valid(domain):
-            return self._cache[domain]
+        # Fetch (conditionally when there is a stale copy) and parse
+        return self._store(domain, stale, self._fetch_robots(url, stale=stale))
+    
+    async def aget_rules(self, session: aiohttp.ClientSession, url: str) -> Optional[RobotsCache]:
+        """Async get_rules; concurrent callers for one domain share a fetch."""
+        domain = self._get_domain(url)
         
-        # Fetch and parse
-        content, status_code = self._fetch_robots(url)
-        rules = self._parse_robots(content) if content else {}
+        loop = asyncio.get_running_loop()
+        if self._alocks_loop is not loop:
+            self._alocks = defaultdict(asyncio.Lock)
+            self._alocks_loop = loop
         
-        cache = RobotsCache(
-            rules=rules,
-            fetched_at=datetime.now(),
-            raw_content=content,
-            status_code=status_code
-        )
+        async with self._alocks[domain]:
+            cache, stale = self._lookup(domain)
+            if cache is not None:
+                return cache
+            return self._store(domain, stale, await self._afetch_robots(session, url, stale=stale))
+    
+    async def ais_allowed(self, session: aiohttp.ClientSession, url: str) -> bool:
+        """Async is_allowed: fetch rules over the session, then match from cache."""
+        await self.aget_rules(session, url)
+        return self.is_allowed(url)
+    
+    def _store(
+        self,
+        domain: str,
+        stale: Optional[RobotsCache],
+        fetched: Tuple[str, int, Optional[str], Optional[str]]
+    ) -> RobotsCache:
+        """Build the cache entry from a fetch result and save it."""
+        content, status_code, etag, last_modified = fetched
+        
+        if status_code == 304 and stale is not None:
+            # Unchanged: keep the stored body and rules, restart the clock
+            stale.fetched_at = datetime.now()
+            cache = stale
+        else:
+            cache = RobotsCache(
+                rules=self._parse_robots(content) if content else {},
+                fetched_at=datetime.now(),
+                raw_content=content,
+                status_code=status_code,
+                etag=etag,
+                last_modified=last_modified
+            )
         
         self._cache[domain] = cache
+        self._save_disk(domain, cache)
         return cache
     
     def is_allowed(self, url: str) -> bool:
@@ -193,12 +459,12 @@ class RobotsChecker:
         Returns True if:
         - robots.txt doesn't exist (404)
         - robots.txt can't be fetched (network error)
-        - Path is explicitly allowed
+        - The longest matching rule is an Allow
         - Path is not disallowed
         
         Returns False if:
-        - Path is explicitly disallowed for our user agent
-        - Path is disallowed for all agents (*)
+        - The longest matching rule for our user agent is a Disallow
+        - Same for all agents (*) when our agent's rules don't match
         """
         cache = self.get_rules(url)
         
@@ -206,25 +472,16 @@ class RobotsChecker:
         if not cache or cache.status_code in (0, 404):
             return True
         
-        parsed = urlparse(url)
-        path = parsed.path or '/'
+        path = _split_url(url)[2]
         
         # Check rules for our user agent first, then wildcard
         for agent_pattern in [self.user_agent.lower(), '*']:
             if agent_pattern not in cache.rules:
                 continue
             
-            rule = cache.rules[agent_pattern]
-            
-            # Check allowed paths first (they take precedence)
-            for allowed in rule.allowed_paths:
-                if self._match_path(allowed, path):
-                    return True
-            
-            # Check disallowed paths
-            for disallowed in rule.disallowed_paths:
-                if self._match_path(disallowed, path):
-                    return False
+            verdict = cache.rules[agent_pattern].match(path)
+            if verdict is not None:
+                return verdict
         
         # Not explicitly disallowed = allowed
         return True
@@ -245,6 +502,22 @@ class RobotsChecker:
         
         return None
     
+    def get_sitemaps(self, url: str) -> List[str]:
+        """Sitemap URLs listed in the robots.txt of a URL's domain."""
+        cache = self.get_rules(url)
+        
+        if not cache or cache.status_code != 200 or not cache.raw_content:
+            return []
+        
+        sitemaps = []
+        for line in cache.raw_content.split('\n'):
+            directive, sep, value = line.partition(':')
+            if sep and directive.strip().lower() == 'sitemap':
+                value = value.split('#', 1)[0].strip()
+                if value:
+                    sitemaps.append(value)
+        return sitemaps
+    
     def get_status(self, url: str) -> dict:
         """Get detailed robots.txt status for a URL."""
         domain = self._get_domain(url)
@@ -264,8 +537,13 @@ class RobotsChecker:
         }
     
     def clear_cache(self, domain: Optional[str] = None):
-        """Clear cached robots.txt data."""
+        """Clear cached robots.txt data (memory and disk)."""
         if domain:
             self._cache.pop(domain, None)
+            paths = [self._disk_path(domain)] if self.cache_dir else []
         else:
             self._cache.clear()
+            paths = list(self.cache_dir.glob('*.json')) if self.cache_dir else []
+        
+        for path in paths:
+            path.unlink(missing_ok=True)
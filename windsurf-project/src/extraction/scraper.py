@@ -16,38 +16,183 @@ import sys
 import re
 import json
 import time
+import asyncio
+import socket
 import hashlib
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Set, Tuple
-from dataclasses import dataclass, field, asdict
+from typing import List, Dict, FrozenSet, Optional, Sequence, Set, Tuple
+from dataclasses import dataclass, field
 from urllib.parse import urlparse, urljoin
-import csv
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import zip_longest
 
 import requests
-from bs4 import BeautifulSoup
-import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import aiohttp
+import lxml.html
+from lxml import etree
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.utils.rate_limiter import RateLimiter, RateLimitConfig
+from src.utils.database import LeadDatabase
+from src.utils.domain_list import iter_domains
 from src.extraction.robots_checker import RobotsChecker
 
 from rich.console import Console
-from rich.progress import Progress, TaskID
-from rich.table import Table
+from rich.progress import Progress
 import click
 
 console = Console()
 
+# __slots__ drops the per-instance __dict__ (dataclass slots need Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Inline SVG icons and <style> blocks carry no page text but can be most of
+# the markup; cut them before parsing so lxml never builds their nodes
+_NON_TEXT_RE = re.compile(r'<svg\b.*?</svg\s*>|<style\b.*?</style\s*>', re.IGNORECASE | re.DOTALL)
+
+# Parse from UTF-8 bytes so <meta charset> / XML declarations can't override
+_HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+# Text nodes that show on the page (what BeautifulSoup's get_text returns)
+_TEXT_XPATH = etree.XPath(
+    '//text()[not(ancestor::script or ancestor::style or ancestor::template)]',
+    smart_strings=False
+)
+
+
+def _parse_html(html: str) -> lxml.html.HtmlElement:
+    """Parse page HTML into an lxml tree, skipping SVG and style subtrees."""
+    data = _NON_TEXT_RE.sub(' ', html).encode('utf-8', 'replace')
+    try:
+        return lxml.html.document_fromstring(data, parser=_HTML_PARSER)
+    except etree.ParserError:
+        # Empty or whitespace-only document
+        return lxml.html.document_fromstring(b'<html></html>', parser=_HTML_PARSER)
+
+
+def _decode_body(body: bytes, charset: Optional[str]) -> str:
+    """Decode a page body with its declared charset, falling back to UTF-8."""
+    try:
+        return body.decode(charset or 'utf-8', errors='replace')
+    except LookupError:
+        return body.decode('utf-8', errors='replace')
+
+
+def _page_text(root: lxml.html.HtmlElement) -> str:
+    """Visible text, each piece stripped and joined with single spaces."""
+    return ' '.join(s for s in map(str.strip, _TEXT_XPATH(root)) if s)
+
+
+def _element_string(el) -> Optional[str]:
+    """An element's text when that is its only child (BeautifulSoup's Tag.string)."""
+    while True:
+        if len(el) == 0:
+            return el.text
+        if len(el) > 1 or el.text or el[0].tail:
+            return None
+        el = el[0]
+
+
+# xxh3 hashes are prefixed; bare hex is MD5 (all hashes stored before xxh3)
+XXH3_HASH_PREFIX = 'xxh3:'
+
+
+def _content_hash(html: str) -> str:
+    """
+    Change-detection hash of a page: 'xxh3:' + xxh3-128 hex when xxhash is
+    installed (an order of magnitude faster), bare MD5 hex otherwise.
+    """
+    data = html.encode('utf-8')
+    if HAS_XXHASH:
+        return XXH3_HASH_PREFIX + xxhash.xxh3_128_hexdigest(data)
+    return hashlib.md5(data).hexdigest()
+
+
+def content_hash_algorithm(content_hash: Optional[str]) -> Optional[str]:
+    """Algorithm of a stored content hash ('xxh3' or 'md5'; None if empty)."""
+    if not content_hash:
+        return None
+    return 'xxh3' if content_hash.startswith(XXH3_HASH_PREFIX) else 'md5'
+
+
+def _json_list(values: Sequence[str]) -> str:
+    """JSON text of a list column (orjson when installed: compact, non-ASCII kept as UTF-8)."""
+    if HAS_ORJSON:
+        return orjson.dumps(values).decode('utf-8')
+    return json.dumps(values)
+
+
+def _interned(values: List) -> List:
+    """
+    Intern extracted strings so values repeated across pages share one
+    object and CompanyProfile's set updates compare by identity.
+    """
+    return [sys.intern(v) if type(v) is str else v for v in values]
+
+
+_WORD_RE = re.compile(r'\w+')
+
+
+class ExtractionCtx:
+    """
+    A page's text, prepared once and shared by the text extractors.
+    
+    words (the distinct \\w+ runs of text_lower) is built on first use,
+    since only the re keyword engine needs it.
+    """
+    
+    __slots__ = ('text', 'text_lower', '_words')
+    
+    def __init__(self, text: str):
+        self.text = text
+        self.text_lower = text.lower()
+        self._words: Optional[FrozenSet[str]] = None
+    
+    @property
+    def words(self) -> FrozenSet[str]:
+        if self._words is None:
+            self._words = frozenset(_WORD_RE.findall(self.text_lower))
+        return self._words
+
 
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(**_SLOTS)
 class ScrapedPage:
     """Represents a scraped web page."""
     url: str
@@ -70,19 +215,60 @@ class ScrapedPage:
     has_job_listings: bool = False
     last_modified: Optional[str] = None
     
+    def to_row(self) -> tuple:
+        """Flat values in PAGE_FIELDS order (lists as JSON, datetimes as ISO)."""
+        # Built by hand: asdict() would deep-copy every list first
+        return (
+            self.url,
+            self.domain,
+            self.title,
+            self.content_hash,
+            self.scraped_at.isoformat(),
+            self.status_code,
+            self.page_type,
+            _json_list(self.job_titles),
+            _json_list(self.tech_keywords),
+            _json_list(self.hiring_signals),
+            _json_list(self.remote_indicators),
+            _json_list(self.contact_emails),
+            self.has_apply_button,
+            self.has_job_listings,
+            self.last_modified,
+        )
+    
     def to_dict(self) -> dict:
-        return {
-            **asdict(self),
-            'scraped_at': self.scraped_at.isoformat(),
-            'job_titles': json.dumps(self.job_titles),
-            'tech_keywords': json.dumps(self.tech_keywords),
-            'hiring_signals': json.dumps(self.hiring_signals),
-            'remote_indicators': json.dumps(self.remote_indicators),
-            'contact_emails': json.dumps(self.contact_emails)
-        }
+        return dict(zip(PAGE_FIELDS, self.to_row()))
+
 
+PAGE_FIELDS = (
+    'url', 'domain', 'title', 'content_hash', 'scraped_at', 'status_code',
+    'page_type', 'job_titles', 'tech_keywords', 'hiring_signals',
+    'remote_indicators', 'contact_emails', 'has_apply_button',
+    'has_job_listings', 'last_modified',
+)
 
-@dataclass
+# Parquet column types, declared so nothing is inferred (and empty or
+# all-null columns still get the right type)
+PAGES_SCHEMA = pa.schema([
+    ('url', pa.string()),
+    ('domain', pa.string()),
+    ('title', pa.string()),
+    ('content_hash', pa.string()),
+    ('scraped_at', pa.timestamp('us')),
+    ('status_code', pa.int64()),
+    ('page_type', pa.string()),
+    ('job_titles', pa.list_(pa.string())),
+    ('tech_keywords', pa.list_(pa.string())),
+    ('hiring_signals', pa.list_(pa.string())),
+    ('remote_indicators', pa.list_(pa.string())),
+    ('contact_emails', pa.list_(pa.string())),
+    ('has_apply_button', pa.bool_()),
+    ('has_job_listings', pa.bool_()),
+    ('last_modified', pa.string()),
+])
+
+
+@dataclass(**_SLOTS)
 class CompanyProfile:
     """Aggregated profile for a company from multiple pages."""
     domain: str
@@ -103,8 +289,13 @@ class CompanyProfile:
     first_seen: Optional[datetime] = None
     last_updated: Optional[datetime] = None
     
+    # Sorted list fields and their JSON, built by finalize(); None when stale
+    _sorted: Optional[Tuple[Tuple[str, ...], ...]] = field(default=None, init=False, repr=False, compare=False)
+    _json: Optional[Tuple[str, ...]] = field(default=None, init=False, repr=False, compare=False)
+    
     def merge_page(self, page: ScrapedPage):
         """Merge data from a scraped page into the profile."""
+        self._sorted = self._json = None
         self.all_job_titles.update(page.job_titles)
         self.all_tech_keywords.update(page.tech_keywords)
         self.all_hiring_signals.update(page.hiring_signals)
@@ -122,6 +313,62 @@ class CompanyProfile:
         
         if not self.first_seen:
             self.first_seen = datetime.now()
+    
+    def finalize(self) -> Tuple[Tuple[str, ...], ...]:
+        """Sort the set fields once and cache them (plus JSON) until the next merge_page."""
+        if self._sorted is None:
+            self._sorted = tuple(tuple(sorted(values)) for values in (
+                self.all_job_titles, self.all_tech_keywords, self.all_hiring_signals,
+                self.all_remote_indicators, self.all_contact_emails,
+            ))
+            self._json = tuple(_json_list(values) for values in self._sorted)
+        return self._sorted
+    
+    def to_row(self) -> tuple:
+        """Flat values in PROFILE_FIELDS order (sets as sorted JSON lists, datetimes as ISO)."""
+        self.finalize()
+        return (
+            self.domain,
+            self.name,
+            self.careers_url or '',
+            *self._json,
+            self.pages_scraped,
+            self.has_active_listings,
+            self.first_seen.isoformat() if self.first_seen else '',
+            self.last_updated.isoformat() if self.last_updated else '',
+        )
+
+
+PROFILE_FIELDS = (
+    'domain', 'name', 'careers_url', 'job_titles', 'tech_keywords',
+    'hiring_signals', 'remote_indicators', 'contact_emails',
+    'pages_scraped', 'has_active_listings', 'first_seen', 'last_updated',
+)
+
+PROFILES_SCHEMA = pa.schema([
+    ('domain', pa.string()),
+    ('name', pa.string()),
+    ('careers_url', pa.string()),
+    ('job_titles', pa.list_(pa.string())),
+    ('tech_keywords', pa.list_(pa.string())),
+    ('hiring_signals', pa.list_(pa.string())),
+    ('remote_indicators', pa.list_(pa.string())),
+    ('contact_emails', pa.list_(pa.string())),
+    ('pages_scraped', pa.int64()),
+    ('has_active_listings', pa.bool_()),
+    ('first_seen', pa.timestamp('us')),
+    ('last_updated', pa.timestamp('us')),
+])
+
+
+def _write_parquet(rows: List[tuple], schema: 'pa.Schema', output_path: Path):
+    """Write rows (tuples in schema order) as a zstd Parquet file, column by column."""
+    columns = list(zip(*rows)) if rows else [()] * len(schema)
+    table = pa.Table.from_arrays(
+        [pa.array(column, type=f.type) for column, f in zip(columns, schema)],
+        schema=schema
+    )
+    pq.write_table(table, output_path, compression='zstd')
 
 
 # =============================================================================
@@ -131,17 +378,17 @@ class CompanyProfile:
 class PageTypeDetector:
     """Detects the type of page based on URL and content."""
     
-    CAREERS_URL_PATTERNS = [
-        r'/careers?/?',
-        r'/jobs?/?',
-        r'/work-with-us/?',
-        r'/join-us/?',
-        r'/opportunities/?',
-        r'/openings/?',
-        r'/positions/?',
-        r'/hiring/?',
-        r'/team/?.*jobs',
-    ]
+    # Plain substrings: '/career' also covers '/careers', '/job' covers '/jobs'
+    CAREERS_URL_TOKENS = (
+        '/career',
+        '/job',
+        '/work-with-us',
+        '/join-us',
+        '/opportunities',
+        '/openings',
+        '/positions',
+        '/hiring',
+    )
     
     CAREERS_CONTENT_PATTERNS = [
         r'open\s+positions?',
@@ -154,15 +401,21 @@ class PageTypeDetector:
         r'view\s+all\s+jobs',
     ]
     
+    # Compiled once; kept separate so each keeps re's literal-prefix scan
+    _CAREERS_CONTENT_RES = [re.compile(p) for p in CAREERS_CONTENT_PATTERNS]
+    
     @classmethod
-    def detect(cls, url: str, soup: BeautifulSoup) -> str:
-        """Detect page type from URL and content."""
+    def detect(cls, url: str, text_lower: str) -> str:
+        """Detect page type from URL and lowercased page text."""
         url_lower = url.lower()
         
         # Check URL patterns
-        for pattern in cls.CAREERS_URL_PATTERNS:
-            if re.search(pattern, url_lower):
+        for token in cls.CAREERS_URL_TOKENS:
+            if token in url_lower:
                 return 'careers'
+        team = url_lower.find('/team')
+        if team != -1 and 'jobs' in url_lower[team + 5:]:
+            return 'careers'
         
         if '/about' in url_lower:
             return 'about'
@@ -172,24 +425,104 @@ class PageTypeDetector:
             return 'engineering'
         
         # Check content patterns
-        text = soup.get_text().lower()
         careers_score = 0
         
-        for pattern in cls.CAREERS_CONTENT_PATTERNS:
-            if re.search(pattern, text):
+        for regex in cls._CAREERS_CONTENT_RES:
+            if regex.search(text_lower):
                 careers_score += 1
-        
-        if careers_score >= 2:
-            return 'careers'
+                if careers_score >= 2:
+                    return 'careers'
         
         return 'other'
 
 
+def _is_word_boundary(text: str, i: int) -> bool:
+    """Same test as regex \\b at index i of text."""
+    before = i > 0 and (text[i - 1].isalnum() or text[i - 1] == '_')
+    after = i < len(text) and (text[i].isalnum() or text[i] == '_')
+    return before != after
+
+
 class TechKeywordExtractor:
     """Extracts technology keywords from page content."""
     
-    def __init__(self, keywords_path: Optional[Path] = None):
+    def __init__(self, keywords_path: Optional[Path] = None, engine: str = 're'):
         self.keywords = self._load_keywords(keywords_path)
+        self._compile(engine)
+    
+    def _compile(self, engine: str):
+        """Build the keyword matcher for the chosen engine."""
+        keywords = list(self.keywords)
+        
+        # Output order is fixed by the config, so sort by weight once here
+        # rather than per page (stable, like the per-page sort it replaces)
+        self._by_weight = sorted(self.keywords.items(), key=lambda x: x[1], reverse=True)
+        
+        if engine == 'hyperscan' and not HAS_HYPERSCAN:
+            console.print("[yellow]hyperscan not installed, using re engine[/yellow]")
+            engine = 're'
+        if engine == 'ahocorasick' and not HAS_AHOCORASICK:
+            console.print("[yellow]pyahocorasick not installed, using re engine[/yellow]")
+            engine = 're'
+        self.engine = engine
+        
+        if engine == 'ahocorasick':
+            # Every occurrence of every keyword in one pass; word
+            # boundaries are checked on the hits
+            self._ac = ahocorasick.Automaton()
+            for keyword in keywords:
+                self._ac.add_word(keyword, keyword)
+            if keywords:
+                self._ac.make_automaton()
+        elif engine == 'hyperscan':
+            self._ids = keywords
+            self._hs_db = hyperscan.Database()
+            flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+            self._hs_db.compile(
+                expressions=[(r'\b' + re.escape(k) + r'\b').encode('utf-8') for k in keywords],
+                ids=list(range(len(keywords))),
+                elements=len(keywords),
+                flags=[flags] * len(keywords)
+            )
+        else:
+            # A keyword made only of word characters matches \b...\b exactly
+            # when it is one of the page's words; the rest ('apache spark',
+            # 'c++') get a substring test and then their own regex
+            self._single = frozenset(k for k in keywords if _WORD_RE.fullmatch(k))
+            self._multi = [
+                (k, re.compile(r'\b' + re.escape(k) + r'\b'))
+                for k in keywords if k not in self._single
+            ]
+    
+    def _scan(self, ctx: ExtractionCtx) -> Set[str]:
+        """Return the set of keywords present in the page text."""
+        text_lower = ctx.text_lower
+        
+        if self.engine == 'hyperscan':
+            hits: Set[str] = set()
+            
+            def on_match(match_id, start, end, flags, context):
+                hits.add(self._ids[match_id])
+            
+            self._hs_db.scan(text_lower.encode('utf-8'), match_event_handler=on_match)
+            return hits
+        
+        if self.engine == 'ahocorasick':
+            hits = set()
+            if self._ac.kind != ahocorasick.AHOCORASICK:
+                return hits
+            for end, keyword in self._ac.iter(text_lower):
+                if keyword not in hits and _is_word_boundary(text_lower, end + 1) \
+                        and _is_word_boundary(text_lower, end + 1 - len(keyword)):
+                    hits.add(keyword)
+            return hits
+        
+        hits = set(self._single & ctx.words)
+        hits.update(
+            keyword for keyword, regex in self._multi
+            if keyword in text_lower and regex.search(text_lower)
+        )
+        return hits
     
     def _load_keywords(self, path: Optional[Path]) -> Dict[str, float]:
         """Load keywords and weights from config."""
@@ -199,6 +532,7 @@ class TechKeywordExtractor:
         keywords = {}
         
         if path.exists():
+            import yaml
             with open(path) as f:
                 data = yaml.safe_load(f)
                 
@@ -222,32 +556,42 @@ class TechKeywordExtractor:
         
         return keywords
     
-    def extract(self, text: str) -> List[Tuple[str, float]]:
-        """Extract tech keywords with their weights."""
-        text_lower = text.lower()
-        found = []
-        
-        for keyword, weight in self.keywords.items():
-            # Word boundary matching
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            if re.search(pattern, text_lower):
-                found.append((keyword, weight))
-        
-        # Sort by weight descending
-        return sorted(found, key=lambda x: x[1], reverse=True)
+    def extract(self, ctx: ExtractionCtx) -> List[Tuple[str, float]]:
+        """Extract tech keywords with their weights from the page text."""
+        hits = self._scan(ctx)
+        # Already sorted by weight descending
+        return [(keyword, weight) for keyword, weight in self._by_weight if keyword in hits]
+
+
+def _loads_json_ld(raw: str):
+    """Parse a JSON-LD blob with orjson, falling back to json for input orjson rejects."""
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
 
 
 class JobTitleExtractor:
     """Extracts job titles from page content."""
     
+    # Common job listing elements, checked by text on the parsed DOM
+    TITLE_TAGS = ['h1', 'h2', 'h3', 'h4', 'a', 'li']
+    TITLE_KEYWORDS = r'engineer|developer|scientist|analyst|architect'
+    
+    # Structured data embedded in scripts: (value pattern, required keywords).
+    # Values are captured with one bounded quantifier and the keywords checked
+    # afterwards, so no two repetitions compete over the same string
     TITLE_PATTERNS = [
-        # Common job listing patterns
-        r'<h[1-4][^>]*>([^<]*(?:engineer|developer|scientist|analyst|architect)[^<]*)</h[1-4]>',
-        r'<a[^>]*>([^<]*(?:engineer|developer|scientist|analyst|architect)[^<]*)</a>',
-        r'<li[^>]*>([^<]*(?:engineer|developer|scientist|analyst|architect)[^<]*)</li>',
-        # Structured data
-        r'"title"\s*:\s*"([^"]*(?:engineer|developer|scientist|analyst)[^"]*)"',
-        r'"jobTitle"\s*:\s*"([^"]*)"',
+        (r'"title"\s*:\s*"([^"]{0,200})"', r'engineer|developer|scientist|analyst'),
+        (r'"jobTitle"\s*:\s*"([^"]{0,200})"', None),
+    ]
+    
+    _TITLE_KEYWORD_RE = re.compile(TITLE_KEYWORDS, re.IGNORECASE)
+    _TITLE_RES = [
+        (re.compile(p, re.IGNORECASE), re.compile(kw, re.IGNORECASE) if kw else None)
+        for p, kw in TITLE_PATTERNS
     ]
     
     SENIORITY_PATTERNS = [
@@ -255,23 +599,37 @@ class JobTitleExtractor:
     ]
     
     @classmethod
-    def extract(cls, html: str, soup: BeautifulSoup) -> List[str]:
-        """Extract job titles from HTML."""
+    def extract(cls, html: str, root: lxml.html.HtmlElement) -> List[str]:
+        """Extract job titles from HTML and its parsed tree."""
         titles = set()
-        html_lower = html.lower()
         
-        for pattern in cls.TITLE_PATTERNS:
-            matches = re.findall(pattern, html_lower, re.IGNORECASE)
+        # One DOM pass over text-only listing elements (no string when an
+        # element holds mixed content)
+        for el in root.iter(cls.TITLE_TAGS):
+            text = _element_string(el)
+            if text and cls._TITLE_KEYWORD_RE.search(text):
+                title = text.strip()
+                if 10 < len(title) < 100:  # Reasonable title length
+                    titles.add(title.title())
+        
+        # Patterns are case-insensitive and matches go through .title(),
+        # so they run on the raw HTML without a lowercased copy
+        for regex, keyword_re in cls._TITLE_RES:
+            matches = regex.findall(html)
             for match in matches:
+                if keyword_re and not keyword_re.search(match):
+                    continue
                 # Clean and validate
                 title = match.strip()
                 if 10 < len(title) < 100:  # Reasonable title length
                     titles.add(title.title())
         
         # Also check structured data (JSON-LD)
-        for script in soup.find_all('script', type='application/ld+json'):
+        for script in root.iter('script'):
+            if script.get('type') != 'application/ld+json':
+                continue
             try:
-                data = json.loads(script.string)
+                data = _loads_json_ld(_element_string(script))
                 if isinstance(data, dict):
                     if data.get('@type') == 'JobPosting':
                         title = data.get('title', '')
@@ -313,20 +671,21 @@ class HiringSignalExtractor:
         r"yc\s+\w+\s+\d{4}",
     ]
     
+    # (compiled pattern, display label with regex syntax removed)
+    _STRONG = [
+        (re.compile(p), "hiring:" + p.replace(r'\s+', ' ').replace(r"'?", '').replace('\\', ''))
+        for p in STRONG_SIGNALS
+    ]
+    _FUNDING_RES = [re.compile(p) for p in FUNDING_SIGNALS]
+    
     @classmethod
-    def extract(cls, text: str) -> List[str]:
-        """Extract hiring signals from text."""
-        text_lower = text.lower()
-        signals = []
-        
-        for pattern in cls.STRONG_SIGNALS:
-            if re.search(pattern, text_lower):
-                # Clean pattern for display (remove regex syntax)
-                clean_pattern = pattern.replace(r'\s+', ' ').replace(r"'?", '').replace('\\', '')
-                signals.append(f"hiring:{clean_pattern}")
-        
-        for pattern in cls.FUNDING_SIGNALS:
-            match = re.search(pattern, text_lower)
+    def extract(cls, ctx: ExtractionCtx) -> List[str]:
+        """Extract hiring signals from the lowercased page text."""
+        text_lower = ctx.text_lower
+        signals = [label for regex, label in cls._STRONG if regex.search(text_lower)]
+        
+        for regex in cls._FUNDING_RES:
+            match = regex.search(text_lower)
             if match:
                 signals.append(f"funding:{match.group()}")
         
@@ -350,21 +709,31 @@ class RemoteIndicatorExtractor:
         r'\bflexible\s+(?:work|location)\b',
     ]
     
+    # Any hit counts, so each family is one alternation and one scan
+    _POSITIVE_RE = re.compile('|'.join(POSITIVE_PATTERNS))
+    _HYBRID_RE = re.compile('|'.join(HYBRID_PATTERNS))
+    
+    # Every match contains one of these words; a substring test is far
+    # cheaper than a \b-anchored scan that finds nothing
+    _POSITIVE_HINTS = ('remote', 'work', 'distributed')
+    _HYBRID_HINTS = ('hybrid', 'flexible')
+    
+    @staticmethod
+    def _search(regex: 're.Pattern', hints: Tuple[str, ...], text_lower: str) -> bool:
+        """regex.search, skipped when none of its required words occur."""
+        return any(hint in text_lower for hint in hints) and regex.search(text_lower) is not None
+    
     @classmethod
-    def extract(cls, text: str) -> List[str]:
-        """Extract remote indicators from text."""
-        text_lower = text.lower()
+    def extract(cls, ctx: ExtractionCtx) -> List[str]:
+        """Extract remote indicators from the lowercased page text."""
+        text_lower = ctx.text_lower
         indicators = []
         
-        for pattern in cls.POSITIVE_PATTERNS:
-            if re.search(pattern, text_lower):
-                indicators.append('remote')
-                break
+        if cls._search(cls._POSITIVE_RE, cls._POSITIVE_HINTS, text_lower):
+            indicators.append('remote')
         
-        for pattern in cls.HYBRID_PATTERNS:
-            if re.search(pattern, text_lower):
-                indicators.append('hybrid')
-                break
+        if cls._search(cls._HYBRID_RE, cls._HYBRID_HINTS, text_lower):
+            indicators.append('hybrid')
         
         return indicators
 
@@ -400,10 +769,21 @@ class EmailExtractor:
         r'team@',
     ]
     
+    # Each list is one alternation: two searches per email instead of 18
+    _EMAIL_RE = re.compile(EMAIL_PATTERN)
+    _SKIP_RE = re.compile('|'.join(SKIP_PATTERNS))
+    _PREFER_RE = re.compile('|'.join(PREFER_PATTERNS))
+    
     @classmethod
-    def extract(cls, text: str) -> List[str]:
+    def extract(cls, ctx: ExtractionCtx) -> List[str]:
         """Extract relevant contact emails."""
-        emails = re.findall(cls.EMAIL_PATTERN, text)
+        text = ctx.text
+        
+        # Most pages have no '@' at all; skip the full regex scan
+        if '@' not in text:
+            return []
+        
+        emails = cls._EMAIL_RE.findall(text)
         
         # Filter and prioritize
         preferred = []
@@ -413,11 +793,11 @@ class EmailExtractor:
             email_lower = email.lower()
             
             # Skip unwanted patterns
-            if any(re.search(p, email_lower) for p in cls.SKIP_PATTERNS):
+            if cls._SKIP_RE.search(email_lower):
                 continue
             
             # Prioritize hiring-related emails
-            if any(re.search(p, email_lower) for p in cls.PREFER_PATTERNS):
+            if cls._PREFER_RE.search(email_lower):
                 preferred.append(email)
             else:
                 other.append(email)
@@ -425,6 +805,109 @@ class EmailExtractor:
         return preferred + other[:3]  # Return preferred + up to 3 others
 
 
+# =============================================================================
+# PAGE EXTRACTION
+# =============================================================================
+
+def _url_domain(url: str) -> str:
+    """Extract domain from URL, without a leading www."""
+    domain = urlparse(url).netloc.lower()
+    if domain.startswith('www.'):
+        domain = domain[4:]
+    return domain
+
+
+_LISTING_CLASS_RE = re.compile(r'job|position|opening', re.I)
+_DIV_CLASSES_XPATH = etree.XPath('//div/@class', smart_strings=False)
+
+
+def _has_listing_class(root: lxml.html.HtmlElement) -> bool:
+    """Whether any <div> class contains job/position/opening, case-insensitively."""
+    # One XPath call and one scan over all class strings instead of a
+    # regex call per div. For ASCII, lower() + 'in' is the same test as
+    # the re.I pattern; re.I also folds e.g. U+017F into 's', so anything
+    # else goes through the regex.
+    classes = '\n'.join(_DIV_CLASSES_XPATH(root))
+    if classes.isascii():
+        classes = classes.lower()
+        return 'job' in classes or 'position' in classes or 'opening' in classes
+    return _LISTING_CLASS_RE.search(classes) is not None
+
+
+def extract_page(
+    url: str,
+    html: str,
+    status_code: int,
+    tech_extractor: TechKeywordExtractor
+) -> ScrapedPage:
+    """
+    Parse fetched HTML and run every extractor over it.
+    
+    Uses no scraper state, so it can run in a worker process.
+    """
+    root = _parse_html(html)
+    
+    # Extract title
+    title_tag = root.find('.//title')
+    title = title_tag.text_content().strip() if title_tag is not None else ""
+    
+    # Get page text for analysis, lowercased once for all detectors
+    ctx = ExtractionCtx(_page_text(root))
+    
+    # Detect page type
+    page_type = PageTypeDetector.detect(url, ctx.text_lower)
+    
+    # Extract data
+    job_titles = _interned(JobTitleExtractor.extract(html, root))
+    tech_keywords = [kw for kw, _ in tech_extractor.extract(ctx)]
+    hiring_signals = _interned(HiringSignalExtractor.extract(ctx))
+    remote_indicators = RemoteIndicatorExtractor.extract(ctx)
+    contact_emails = _interned(EmailExtractor.extract(ctx))
+    
+    # Check for apply button (no character other than A/P/L/Y lowercases
+    # into 'apply', so this is the same test as re.search('apply', re.I))
+    has_apply = any(
+        'apply' in text.lower()
+        for text in map(_element_string, root.iter('a', 'button'))
+        if text
+    )
+    
+    # Check for job listings (multiple job titles or listing structure)
+    has_listings = len(job_titles) > 1 or _has_listing_class(root)
+    
+    return ScrapedPage(
+        url=url,
+        domain=_url_domain(url),
+        title=title,
+        content_hash=_content_hash(html),
+        scraped_at=datetime.now(),
+        status_code=status_code,
+        page_type=page_type,
+        job_titles=job_titles,
+        tech_keywords=tech_keywords,
+        hiring_signals=hiring_signals,
+        remote_indicators=remote_indicators,
+        contact_emails=contact_emails,
+        has_apply_button=has_apply,
+        has_job_listings=has_listings
+    )
+
+
+# Worker-process state for extraction pools (see _init_extract_worker)
+_worker_tech_extractor: Optional[TechKeywordExtractor] = None
+
+
+def _init_extract_worker(engine: str):
+    """ProcessPoolExecutor initializer: build the keyword matcher once per process."""
+    global _worker_tech_extractor
+    _worker_tech_extractor = TechKeywordExtractor(engine=engine)
+
+
+def _extract_in_worker(url: str, html: str, status_code: int) -> ScrapedPage:
+    """extract_page with the worker's own keyword matcher."""
+    return extract_page(url, html, status_code, _worker_tech_extractor)
+
+
 # =============================================================================
 # SCRAPER
 # =============================================================================
@@ -434,7 +917,7 @@ class JobMarketScraper:
     Main scraper for hidden job market intelligence.
     
     Tiers:
-    - MVP: requests + BeautifulSoup
+    - MVP: requests + lxml
     - Beta: Add Playwright for JS rendering
     - Advanced: Add ML classification, change detection
     """
@@ -459,26 +942,71 @@ class JobMarketScraper:
         '/company/careers',
     ]
     
+    # Careers-like <loc> entries from the robots.txt sitemap are tried first
+    SITEMAP_LOC_RE = re.compile(r'<loc>\s*([^<\s]+)\s*</loc>', re.IGNORECASE)
+    MAX_SITEMAP_CANDIDATES = 3
+    
+    # Bodies are streamed and cut off here, so one huge page can't balloon memory
+    MAX_PAGE_BYTES = 2 * 1024 * 1024
+    
+    # Cached pages older than this are fetched unconditionally again
+    PAGE_CACHE_TTL_SEC = 30 * 24 * 3600
+    READ_CHUNK_BYTES = 64 * 1024
+    
     def __init__(
         self,
         config_path: Optional[Path] = None,
         respect_robots: bool = True,
-        rate_limit: bool = True
+        rate_limit: bool = True,
+        checkpoint_ttl_hours: Optional[float] = None,
+        engine: str = 're',
+        workers: int = 0,
+        page_cache: bool = False
     ):
         self.config = self._load_config(config_path)
         self.respect_robots = respect_robots
         
+        # Resume support: URLs fetched within the TTL are not fetched again,
+        # their stored extraction is reused (disabled when None)
+        self.checkpoint_ttl_hours = checkpoint_ttl_hours
+        self.checkpoint_db = LeadDatabase() if checkpoint_ttl_hours else None
+        
+        # Conditional re-fetch: pages are cached with their ETag/Last-Modified
+        # and a 304 reuses the cached extraction (disabled when False)
+        self.page_cache_db = (self.checkpoint_db or LeadDatabase()) if page_cache else None
+        
         # Initialize components
-        self.robots_checker = RobotsChecker() if respect_robots else None
+        self.robots_checker = RobotsChecker(
+            cache_hours=self.config.get('extraction', {}).get('robots', {}).get('cache_hours', 24)
+        ) if respect_robots else None
         self.rate_limiter = RateLimiter(RateLimitConfig(
             min_delay_sec=self.config.get('extraction', {}).get('requests', {}).get('delay_min_sec', 2),
             max_delay_sec=self.config.get('extraction', {}).get('requests', {}).get('delay_max_sec', 5),
         )) if rate_limit else None
         
-        self.tech_extractor = TechKeywordExtractor()
+        self.tech_extractor = TechKeywordExtractor(engine=engine)
         
-        # Session for connection pooling
+        # Async pipeline only: parse/extract in this many processes
+        # (<= 1 runs inline, negative means one per CPU)
+        self.workers = workers if workers >= 0 else (os.cpu_count() or 1)
+        self._extract_pool: Optional[ProcessPoolExecutor] = None
+        
+        # Session for connection pooling; the pool is sized so every host in a
+        # batch keeps its keep-alive connection across careers-path probes.
+        # 429 is left to the rate limiter, so it isn't in the retry list
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=64,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False
+            )
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.session.headers.update(self.DEFAULT_HEADERS)
         self.session.headers['User-Agent'] = self.config.get(
             'extraction', {}
@@ -487,6 +1015,12 @@ class JobMarketScraper:
         # Results storage
         self.scraped_pages: List[ScrapedPage] = []
         self.company_profiles: Dict[str, CompanyProfile] = {}
+        
+        # Per-host politeness state for the async pipeline (reset per run);
+        # per_host_delay None means the rate limiter's jittered delay
+        self.per_host_delay: Optional[float] = None if rate_limit else 0.0
+        self._host_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._host_last_hit: Dict[str, float] = {}
     
     def _load_config(self, config_path: Optional[Path]) -> dict:
         """Load configuration."""
@@ -497,21 +1031,145 @@ class JobMarketScraper:
             config_path = PROJECT_ROOT / 'config' / 'config.example.yaml'
         
         if config_path.exists():
+            import yaml
             with open(config_path) as f:
                 return yaml.safe_load(f)
         return {}
     
     def _get_domain(self, url: str) -> str:
         """Extract domain from URL."""
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower()
-        if domain.startswith('www.'):
-            domain = domain[4:]
-        return domain
+        return _url_domain(url)
+    
+    def _is_checkpointed(self, url: str) -> bool:
+        """Check if URL was fetched within the checkpoint TTL."""
+        if not self.checkpoint_db:
+            return False
+        checkpoint = self.checkpoint_db.get_checkpoint(url)
+        if not checkpoint:
+            return False
+        return time.time() - checkpoint['fetched_at'] < self.checkpoint_ttl_hours * 3600
+    
+    def _update_checkpoint(self, url: str, html: str) -> bool:
+        """
+        Record the content hash for URL.
+        
+        Returns:
+            True if the content changed since the last checkpoint
+        """
+        if not self.checkpoint_db:
+            return True
+        content_hash = hashlib.sha256(html.encode()).digest()
+        checkpoint = self.checkpoint_db.get_checkpoint(url)
+        self.checkpoint_db.save_checkpoint(url, content_hash)
+        return not checkpoint or checkpoint['content_hash'] != content_hash
+    
+    def _checkpoint_page_key(self, url: str) -> bytes:
+        """Key of a URL's checkpointed page in the database cache table."""
+        return hashlib.sha256(b'checkpoint\0' + url.encode('utf-8')).digest()
+    
+    def _get_checkpoint_page(self, url: str) -> Optional[dict]:
+        """The extracted page stored with URL's checkpoint, if any."""
+        if not self.checkpoint_db:
+            return None
+        raw = self.checkpoint_db.cache_get(self._checkpoint_page_key(url), self.PAGE_CACHE_TTL_SEC)
+        return json.loads(raw) if raw is not None else None
+    
+    def _save_checkpoint_page(self, page: ScrapedPage) -> ScrapedPage:
+        """Store an extracted page with its checkpoint so a resumed run can reuse it."""
+        if self.checkpoint_db:
+            self.checkpoint_db.cache_set(
+                self._checkpoint_page_key(page.url), json.dumps(self._page_entry(page)).encode('utf-8')
+            )
+        return page
+    
+    def _resume_page(self, url: str) -> Optional[ScrapedPage]:
+        """
+        Record URL's stored page if it was fetched within the checkpoint TTL.
+        
+        Returns:
+            The restored page, or None if URL has to be fetched
+        """
+        if not self._is_checkpointed(url):
+            return None
+        entry = self._get_checkpoint_page(url)
+        return self._restore_page(entry) if entry else None
+    
+    def _unchanged_page(self, url: str, html: str) -> Optional[ScrapedPage]:
+        """
+        Update URL's checkpoint with freshly fetched HTML; if the content is
+        unchanged and its extraction was stored, record that without parsing.
+        
+        Returns:
+            The restored page, or None if the HTML has to be parsed
+        """
+        if self._update_checkpoint(url, html):
+            return None
+        entry = self._get_checkpoint_page(url)
+        return self._save_checkpoint_page(self._restore_page(entry, datetime.now())) if entry else None
+    
+    def _page_entry(self, page: ScrapedPage) -> dict:
+        """A page's fields as stored in the cache table."""
+        return dict(zip(PAGE_FIELDS, (
+            page.url, page.domain, page.title, page.content_hash,
+            page.scraped_at.isoformat(), page.status_code, page.page_type,
+            page.job_titles, page.tech_keywords, page.hiring_signals,
+            page.remote_indicators, page.contact_emails,
+            page.has_apply_button, page.has_job_listings, page.last_modified
+        )))
+    
+    def _restore_page(self, entry: dict, scraped_at: Optional[datetime] = None) -> ScrapedPage:
+        """Record a page rebuilt from a stored entry (keeping its scrape time by default)."""
+        data = dict(entry)
+        data['scraped_at'] = scraped_at or datetime.fromisoformat(data['scraped_at'])
+        data['job_titles'] = _interned(data['job_titles'])
+        data['hiring_signals'] = _interned(data['hiring_signals'])
+        data['contact_emails'] = _interned(data['contact_emails'])
+        return self._record_page(ScrapedPage(**data))
+    
+    def _page_cache_key(self, url: str) -> bytes:
+        """Key of a URL's entry in the database cache table."""
+        return hashlib.sha256(b'page\0' + url.encode('utf-8')).digest()
+    
+    def _get_cached_page(self, url: str) -> Optional[dict]:
+        """Cached validators and extracted page for a URL, if any."""
+        if not self.page_cache_db:
+            return None
+        raw = self.page_cache_db.cache_get(self._page_cache_key(url), self.PAGE_CACHE_TTL_SEC)
+        return json.loads(raw) if raw is not None else None
     
-    def _compute_hash(self, content: str) -> str:
-        """Compute content hash for change detection."""
-        return hashlib.md5(content.encode()).hexdigest()
+    def _cache_page(self, page: ScrapedPage, etag: Optional[str], last_modified: Optional[str]):
+        """Store a page with its validators so the next run can revalidate it."""
+        if not self.page_cache_db or page.status_code != 200 or not (etag or last_modified):
+            return
+        entry = {
+            'etag': etag,
+            'last_modified': last_modified,
+            'page': self._page_entry(page)
+        }
+        self.page_cache_db.cache_set(self._page_cache_key(page.url), json.dumps(entry).encode('utf-8'))
+    
+    def _conditional_headers(self, cached: Optional[dict]) -> Optional[Dict[str, str]]:
+        """Revalidation headers for a cached page."""
+        if not cached:
+            return None
+        headers = {}
+        if cached['etag']:
+            headers['If-None-Match'] = cached['etag']
+        if cached['last_modified']:
+            headers['If-Modified-Since'] = cached['last_modified']
+        return headers
+    
+    def _reuse_cached_page(self, url: str, cached: dict) -> ScrapedPage:
+        """
+        Handle a 304: the page is unchanged, so its cached extraction is
+        recorded again without parsing (and its checkpoint refreshed).
+        """
+        if self.checkpoint_db:
+            checkpoint = self.checkpoint_db.get_checkpoint(url)
+            if checkpoint:
+                self.checkpoint_db.save_checkpoint(url, checkpoint['content_hash'])
+        
+        return self._save_checkpoint_page(self._restore_page(cached['page'], datetime.now()))
     
     def _check_robots(self, url: str) -> bool:
         """Check if URL is allowed by robots.txt."""
@@ -519,10 +1177,17 @@ class JobMarketScraper:
             return True
         return self.robots_checker.is_allowed(url)
     
-    def _apply_rate_limit(self, domain: str):
-        """Apply rate limiting before request."""
+    async def _acheck_robots(self, session: aiohttp.ClientSession, url: str) -> bool:
+        """Async counterpart of _check_robots."""
+        if not self.robots_checker:
+            return True
+        return await self.robots_checker.ais_allowed(session, url)
+    
+    def _apply_rate_limit(self, domain: str, url: str):
+        """Apply rate limiting (including robots.txt crawl-delay) before request."""
         if self.rate_limiter:
-            self.rate_limiter.wait_if_needed(domain)
+            crawl_delay = self.robots_checker.get_crawl_delay(url) if self.robots_checker else None
+            self.rate_limiter.wait_if_needed(domain, crawl_delay)
     
     def _record_request(self, domain: str, success: bool, is_rate_limit: bool = False):
         """Record request for rate limiting."""
@@ -539,6 +1204,21 @@ class JobMarketScraper:
         Returns:
             Tuple of (html_content, status_code) or None if blocked/failed
         """
+        result = self._fetch(url)
+        return result[:2] if result else None
+    
+    def _fetch(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Optional[Tuple[str, int, Optional[str], Optional[str]]]:
+        """
+        fetch_page with extra request headers, also returning the page's
+        validators.
+        
+        Returns:
+            Tuple of (html_content, status_code, etag, last_modified) or None
+        """
         domain = self._get_domain(url)
         
         # Check robots.txt
@@ -547,20 +1227,30 @@ class JobMarketScraper:
             return None
         
         # Apply rate limiting
-        self._apply_rate_limit(domain)
+        self._apply_rate_limit(domain, url)
         
         try:
             timeout = self.config.get('extraction', {}).get('requests', {}).get('timeout_sec', 15)
-            response = self.session.get(url, timeout=timeout, allow_redirects=True)
+            with self.session.get(url, timeout=timeout, allow_redirects=True, stream=True, headers=headers) as response:
+                status_code = response.status_code
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                chunks, size = [], 0
+                for chunk in response.iter_content(self.READ_CHUNK_BYTES):
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= self.MAX_PAGE_BYTES:
+                        break
+                html = _decode_body(b''.join(chunks)[:self.MAX_PAGE_BYTES], response.encoding)
             
             self._record_request(domain, True)
             
-            if response.status_code == 429:
+            if status_code == 429:
                 self._record_request(domain, False, is_rate_limit=True)
                 console.print(f"[red]Rate limited: {url}[/red]")
                 return None
             
-            return response.text, response.status_code
+            return html, status_code, etag, last_modified
             
         except requests.RequestException as e:
             self._record_request(domain, False)
@@ -572,63 +1262,41 @@ class JobMarketScraper:
         Scrape a single page and extract all relevant data.
         
         Returns:
-            ScrapedPage object or None if failed
+            ScrapedPage object (restored from its checkpoint when fetched
+            within the TTL) or None if failed
         """
-        result = self.fetch_page(url)
+        page = self._resume_page(url)
+        if page:
+            return page
+        
+        cached = self._get_cached_page(url)
+        result = self._fetch(url, self._conditional_headers(cached))
         if not result:
             return None
         
-        html, status_code = result
-        soup = BeautifulSoup(html, 'lxml')
-        
-        # Extract title
-        title_tag = soup.find('title')
-        title = title_tag.get_text().strip() if title_tag else ""
-        
-        # Get page text for analysis
-        text = soup.get_text(separator=' ', strip=True)
-        
-        # Detect page type
-        page_type = PageTypeDetector.detect(url, soup)
-        
-        # Extract data
-        job_titles = JobTitleExtractor.extract(html, soup)
-        tech_keywords = [kw for kw, _ in self.tech_extractor.extract(text)]
-        hiring_signals = HiringSignalExtractor.extract(text)
-        remote_indicators = RemoteIndicatorExtractor.extract(text)
-        contact_emails = EmailExtractor.extract(text)
-        
-        # Check for apply button
-        has_apply = bool(soup.find('a', string=re.compile(r'apply', re.I))) or \
-                    bool(soup.find('button', string=re.compile(r'apply', re.I)))
-        
-        # Check for job listings (multiple job titles or listing structure)
-        has_listings = len(job_titles) > 1 or \
-                       bool(soup.find_all('div', class_=re.compile(r'job|position|opening', re.I)))
-        
-        page = ScrapedPage(
-            url=url,
-            domain=self._get_domain(url),
-            title=title,
-            content_hash=self._compute_hash(html),
-            scraped_at=datetime.now(),
-            status_code=status_code,
-            page_type=page_type,
-            job_titles=job_titles,
-            tech_keywords=tech_keywords,
-            hiring_signals=hiring_signals,
-            remote_indicators=remote_indicators,
-            contact_emails=contact_emails,
-            has_apply_button=has_apply,
-            has_job_listings=has_listings
-        )
+        html, status_code, etag, last_modified = result
+        if status_code == 304 and cached:
+            return self._reuse_cached_page(url, cached)
+        page = self._unchanged_page(url, html)
+        if page:
+            return page
         
+        page = self._build_page(url, html, status_code)
+        self._cache_page(page, etag, last_modified)
+        return self._save_checkpoint_page(page)
+    
+    def _build_page(self, url: str, html: str, status_code: int) -> ScrapedPage:
+        """Parse fetched HTML, record the page and merge it into its company profile."""
+        return self._record_page(extract_page(url, html, status_code, self.tech_extractor))
+    
+    def _record_page(self, page: ScrapedPage) -> ScrapedPage:
+        """Store an extracted page and merge it into its company profile."""
         self.scraped_pages.append(page)
         
         # Update company profile
         domain = page.domain
         if domain not in self.company_profiles:
-            self.company_profiles[domain] = CompanyProfile(domain=domain, name=title.split('|')[0].strip())
+            self.company_profiles[domain] = CompanyProfile(domain=domain, name=page.title.split('|')[0].strip())
         self.company_profiles[domain].merge_page(page)
         
         return page
@@ -637,26 +1305,92 @@ class JobMarketScraper:
         """
         Try to find the careers page for a domain.
         
+        Careers-like URLs from the domain's sitemap are tried first; then
+        each of CAREERS_PATHS is HEAD-probed and only fetched in full
+        when it exists.
+        
         Returns:
             URL of careers page if found, None otherwise
         """
         parsed = urlparse(base_url)
         base = f"{parsed.scheme}://{parsed.netloc}"
         
+        candidates = []
+        sitemaps = self.robots_checker.get_sitemaps(base) if self.robots_checker else []
+        if sitemaps:
+            result = self.fetch_page(sitemaps[0])
+            if result and result[1] == 200:
+                candidates = self._sitemap_careers_urls(base, result[0])
+        
+        for url in candidates:
+            result = self.fetch_page(url)
+            if result and self._is_careers_page(url, *result):
+                return url
+        
         for path in self.CAREERS_PATHS:
             url = urljoin(base, path)
+            if url in candidates or not self._probe(url):
+                continue
+            
             result = self.fetch_page(url)
             
             if result:
                 html, status_code = result
-                if status_code == 200:
-                    soup = BeautifulSoup(html, 'lxml')
-                    page_type = PageTypeDetector.detect(url, soup)
-                    if page_type == 'careers':
-                        return url
+                if self._is_careers_page(url, html, status_code):
+                    return url
         
         return None
     
+    def _sitemap_careers_urls(self, base: str, xml: str) -> List[str]:
+        """Careers-like page URLs on base's domain listed in a sitemap, shortest first."""
+        domain = self._get_domain(base)
+        found = set()
+        
+        for loc in self.SITEMAP_LOC_RE.findall(xml):
+            loc = loc.replace('&amp;', '&')
+            path = urlparse(loc).path.lower()
+            if path.endswith(('.xml', '.xml.gz')) or self._get_domain(loc) != domain:
+                continue
+            if any(token in path for token in PageTypeDetector.CAREERS_URL_TOKENS):
+                found.add(loc)
+        
+        return sorted(found, key=lambda u: (len(u), u))[:self.MAX_SITEMAP_CANDIDATES]
+    
+    def _probe(self, url: str) -> bool:
+        """
+        HEAD a URL (robots-checked and rate limited like a fetch).
+        
+        False when it is blocked, unreachable or answers 4xx/5xx; servers
+        that don't implement HEAD (405/501) count as present.
+        """
+        domain = self._get_domain(url)
+        
+        if not self._check_robots(url):
+            return False
+        
+        self._apply_rate_limit(domain, url)
+        
+        try:
+            timeout = self.config.get('extraction', {}).get('requests', {}).get('timeout_sec', 15)
+            response = self.session.head(url, timeout=timeout, allow_redirects=True)
+        except requests.RequestException:
+            self._record_request(domain, False)
+            return False
+        
+        if response.status_code == 429:
+            self._record_request(domain, False, is_rate_limit=True)
+            return False
+        
+        self._record_request(domain, True)
+        return response.status_code < 400 or response.status_code in (405, 501)
+    
+    def _is_careers_page(self, url: str, html: str, status_code: int) -> bool:
+        """Check whether a fetched page is a careers page."""
+        if status_code != 200:
+            return False
+        text_lower = _page_text(_parse_html(html)).lower()
+        return PageTypeDetector.detect(url, text_lower) == 'careers'
+    
     def scrape_domain(self, domain: str, max_pages: int = 5) -> CompanyProfile:
         """
         Scrape a domain for job-related content.
@@ -695,64 +1429,382 @@ class JobMarketScraper:
         
         return self.company_profiles.get(domain, CompanyProfile(domain=domain))
     
-    def scrape_domains(self, domains: List[str], max_pages_per_domain: int = 5) -> List[CompanyProfile]:
-        """Scrape multiple domains."""
-        profiles = []
+    def scrape_domains(
+        self,
+        domains: List[str],
+        max_pages_per_domain: int = 5,
+        concurrency: int = 20
+    ) -> List[CompanyProfile]:
+        """
+        Scrape multiple domains concurrently.
+        
+        Blocking wrapper around scrape_domains_async (hosts in parallel,
+        per-host politeness delay); call that directly from async code.
+        """
+        return asyncio.run(self.scrape_domains_async(
+            domains, max_pages_per_domain, concurrency=concurrency
+        ))
+    
+    # =========================================================================
+    # ASYNC PIPELINE
+    # =========================================================================
+    
+    async def _afetch_page(self, session: aiohttp.ClientSession, url: str) -> Optional[Tuple[str, int]]:
+        """Async counterpart of fetch_page using a shared aiohttp session."""
+        result = await self._afetch(session, url)
+        return result[:2] if result else None
+    
+    async def _afetch(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Optional[Tuple[str, int, Optional[str], Optional[str]]]:
+        """Async counterpart of _fetch."""
+        domain = self._get_domain(url)
+        
+        # robots.txt is fetched over the same session, without blocking the loop
+        if not await self._acheck_robots(session, url):
+            console.print(f"[yellow]Blocked by robots.txt: {url}[/yellow]")
+            return None
+        
+        await self._await_host_slot(domain, url)
+        
+        try:
+            async with session.get(url, allow_redirects=True, headers=headers) as response:
+                status_code = response.status
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                chunks, size = [], 0
+                async for chunk in response.content.iter_chunked(self.READ_CHUNK_BYTES):
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= self.MAX_PAGE_BYTES:
+                        break
+                html = _decode_body(b''.join(chunks)[:self.MAX_PAGE_BYTES], response.charset)
+            
+            self._record_request(domain, True)
+            
+            if status_code == 429:
+                self._record_request(domain, False, is_rate_limit=True)
+                console.print(f"[red]Rate limited: {url}[/red]")
+                return None
+            
+            return html, status_code, etag, last_modified
+            
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self._record_request(domain, False)
+            console.print(f"[red]Request failed: {url} - {e}[/red]")
+            return None
+    
+    async def _aprobe(self, session: aiohttp.ClientSession, url: str) -> bool:
+        """Async counterpart of _probe."""
+        domain = self._get_domain(url)
+        
+        if not await self._acheck_robots(session, url):
+            return False
+        
+        await self._await_host_slot(domain, url)
+        
+        try:
+            async with session.head(url, allow_redirects=True) as response:
+                status_code = response.status
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self._record_request(domain, False)
+            return False
+        
+        if status_code == 429:
+            self._record_request(domain, False, is_rate_limit=True)
+            return False
         
-        with Progress() as progress:
-            task = progress.add_task("[cyan]Scraping domains...", total=len(domains))
+        self._record_request(domain, True)
+        return status_code < 400 or status_code in (405, 501)
+    
+    async def _await_host_slot(self, domain: str, url: str):
+        """
+        Wait for the host's next request slot.
+        
+        With rate limiting on, the slot comes from the rate limiter, the
+        same policy as the sync path (backoff, jittered delay or
+        per_host_delay, robots.txt crawl-delay); otherwise requests are
+        spaced by per_host_delay. Requests to the same host are spaced out
+        while different hosts proceed concurrently.
+        """
+        async with self._host_locks[domain]:
+            if self.rate_limiter:
+                # Rules are cached by the robots check that precedes every request
+                crawl_delay = self.robots_checker.get_crawl_delay(url) if self.robots_checker else None
+                wait = self.rate_limiter.reserve(domain, crawl_delay, self.per_host_delay)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                return
             
-            for domain in domains:
-                profile = self.scrape_domain(domain, max_pages_per_domain)
-                profiles.append(profile)
-                progress.update(task, advance=1)
+            elapsed = time.monotonic() - self._host_last_hit.get(domain, float('-inf'))
+            if elapsed < self.per_host_delay:
+                await asyncio.sleep(self.per_host_delay - elapsed)
+            self._host_last_hit[domain] = time.monotonic()
+    
+    def _interleave_by_host(self, domains: List[str]) -> List[str]:
+        """Order domains round-robin by host so consecutive tasks hit different hosts."""
+        by_host: Dict[str, List[str]] = defaultdict(list)
+        for domain in domains:
+            by_host[self._get_domain(f"https://{domain}")].append(domain)
+        
+        return [
+            domain
+            for batch in zip_longest(*by_host.values())
+            for domain in batch
+            if domain is not None
+        ]
+    
+    async def _prewarm_dns(self, hosts: List[str], concurrency: int = 64):
+        """
+        Resolve every host in parallel before the batch starts.
+
+        Lookups go through the system resolver, so its cache (and the
+        connector's ThreadedResolver behind it) answers the real
+        requests without a serial round trip. Failures are ignored;
+        the fetch itself reports them.
+        """
+        loop = asyncio.get_running_loop()
+        sem = asyncio.Semaphore(concurrency)
+
+        async def resolve(host: str):
+            async with sem:
+                await loop.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+
+        await asyncio.gather(*(resolve(host) for host in hosts), return_exceptions=True)
+    
+    async def _ascrape_page(self, session: aiohttp.ClientSession, url: str) -> Optional[ScrapedPage]:
+        """Async counterpart of scrape_page."""
+        page = self._resume_page(url)
+        if page:
+            return page
+        
+        cached = self._get_cached_page(url)
+        result = await self._afetch(session, url, self._conditional_headers(cached))
+        if not result:
+            return None
+        
+        html, status_code, etag, last_modified = result
+        if status_code == 304 and cached:
+            return self._reuse_cached_page(url, cached)
+        page = self._unchanged_page(url, html)
+        if page:
+            return page
+        
+        if self._extract_pool is None:
+            page = self._build_page(url, html, status_code)
+        else:
+            # CPU-bound parsing runs in a worker; recording stays in this process
+            page = self._record_page(await asyncio.get_running_loop().run_in_executor(
+                self._extract_pool, _extract_in_worker, url, html, status_code
+            ))
+        
+        self._cache_page(page, etag, last_modified)
+        return self._save_checkpoint_page(page)
+    
+    async def _adiscover_careers_page(self, session: aiohttp.ClientSession, base_url: str) -> Optional[str]:
+        """Async counterpart of discover_careers_page."""
+        parsed = urlparse(base_url)
+        base = f"{parsed.scheme}://{parsed.netloc}"
+        
+        candidates = []
+        if self.robots_checker:
+            await self.robots_checker.aget_rules(session, base)
+            sitemaps = self.robots_checker.get_sitemaps(base)
+            if sitemaps:
+                result = await self._afetch_page(session, sitemaps[0])
+                if result and result[1] == 200:
+                    candidates = self._sitemap_careers_urls(base, result[0])
+        
+        for url in candidates:
+            result = await self._afetch_page(session, url)
+            if result and self._is_careers_page(url, *result):
+                return url
+        
+        for path in self.CAREERS_PATHS:
+            url = urljoin(base, path)
+            if url in candidates or not await self._aprobe(session, url):
+                continue
+            
+            result = await self._afetch_page(session, url)
+            
+            if result:
+                html, status_code = result
+                if self._is_careers_page(url, html, status_code):
+                    return url
+        
+        return None
+    
+    async def _ascrape_domain(
+        self,
+        session: aiohttp.ClientSession,
+        domain: str,
+        max_pages: int = 5
+    ) -> CompanyProfile:
+        """Async counterpart of scrape_domain."""
+        base_url = f"https://{domain}"
+        pages_scraped = 0
+        
+        careers_url = await self._adiscover_careers_page(session, base_url)
+        
+        if careers_url:
+            page = await self._ascrape_page(session, careers_url)
+            if page:
+                pages_scraped += 1
+                console.print(f"[green]Found careers page: {careers_url}[/green]")
+        
+        if pages_scraped < max_pages:
+            page = await self._ascrape_page(session, base_url)
+            if page:
+                pages_scraped += 1
+        
+        if pages_scraped < max_pages:
+            page = await self._ascrape_page(session, urljoin(base_url, '/about'))
+            if page:
+                pages_scraped += 1
+        
+        return self.company_profiles.get(domain, CompanyProfile(domain=domain))
+    
+    async def scrape_domains_async(
+        self,
+        domains: List[str],
+        max_pages_per_domain: int = 5,
+        concurrency: int = 20,
+        per_host_delay: Optional[float] = None
+    ) -> List[CompanyProfile]:
+        """
+        Scrape multiple domains concurrently over one shared aiohttp session.
+        
+        Requests to the same host are serialized and paced by the rate
+        limiter, with per_host_delay seconds between them if given (else
+        the configured jittered delay); different hosts run in parallel.
+        A failure on one domain is reported and skipped rather than
+        aborting the whole batch.
+        """
+        if per_host_delay is not None:
+            self.per_host_delay = per_host_delay
+        self._host_locks = defaultdict(asyncio.Lock)
+        self._host_last_hit = {}
+        domains = self._interleave_by_host(domains)
+        await self._prewarm_dns(list(dict.fromkeys(domains)))
+        
+        timeout = self.config.get('extraction', {}).get('requests', {}).get('timeout_sec', 15)
+        connector = aiohttp.TCPConnector(limit=concurrency, ttl_dns_cache=300, keepalive_timeout=30)
+        sem = asyncio.Semaphore(concurrency)
+        
+        if self.workers > 1:
+            self._extract_pool = ProcessPoolExecutor(
+                self.workers,
+                initializer=_init_extract_worker,
+                initargs=(self.tech_extractor.engine,)
+            )
+        
+        try:
+            with Progress() as progress:
+                task = progress.add_task("[cyan]Scraping domains...", total=len(domains))
+                
+                async def run(domain: str) -> CompanyProfile:
+                    try:
+                        async with sem:
+                            return await self._ascrape_domain(session, domain, max_pages_per_domain)
+                    finally:
+                        progress.update(task, advance=1)
+                
+                async with aiohttp.ClientSession(
+                    connector=connector,
+                    headers=dict(self.session.headers),
+                    timeout=aiohttp.ClientTimeout(total=timeout)
+                ) as session:
+                    results = await asyncio.gather(
+                        *(run(domain) for domain in domains),
+                        return_exceptions=True
+                    )
+        finally:
+            if self._extract_pool is not None:
+                self._extract_pool.shutdown()
+                self._extract_pool = None
+        
+        profiles = []
+        for domain, result in zip(domains, results):
+            if isinstance(result, BaseException):
+                console.print(f"[red]Failed to scrape {domain}: {result}[/red]")
+                continue
+            profiles.append(result)
         
         return profiles
     
+    # Large write buffer: rows are small and a CSV export is one sequential write
+    CSV_BUFFER_BYTES = 1 << 20
+    
     def export_pages_csv(self, output_path: Path):
         """Export scraped pages to CSV."""
+        import csv
+        
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=self.CSV_BUFFER_BYTES) as f:
             if self.scraped_pages:
-                fieldnames = list(self.scraped_pages[0].to_dict().keys())
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                for page in self.scraped_pages:
-                    writer.writerow(page.to_dict())
+                writer = csv.writer(f)
+                writer.writerow(PAGE_FIELDS)
+                writer.writerows(page.to_row() for page in self.scraped_pages)
         
         console.print(f"[green]Exported {len(self.scraped_pages)} pages to {output_path}[/green]")
     
     def export_profiles_csv(self, output_path: Path):
         """Export company profiles to CSV."""
+        import csv
+        
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            fieldnames = [
-                'domain', 'name', 'careers_url', 'job_titles', 'tech_keywords',
-                'hiring_signals', 'remote_indicators', 'contact_emails',
-                'pages_scraped', 'has_active_listings', 'first_seen', 'last_updated'
-            ]
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for profile in self.company_profiles.values():
-                writer.writerow({
-                    'domain': profile.domain,
-                    'name': profile.name,
-                    'careers_url': profile.careers_url or '',
-                    'job_titles': json.dumps(list(profile.all_job_titles)),
-                    'tech_keywords': json.dumps(list(profile.all_tech_keywords)),
-                    'hiring_signals': json.dumps(list(profile.all_hiring_signals)),
-                    'remote_indicators': json.dumps(list(profile.all_remote_indicators)),
-                    'contact_emails': json.dumps(list(profile.all_contact_emails)),
-                    'pages_scraped': profile.pages_scraped,
-                    'has_active_listings': profile.has_active_listings,
-                    'first_seen': profile.first_seen.isoformat() if profile.first_seen else '',
-                    'last_updated': profile.last_updated.isoformat() if profile.last_updated else ''
-                })
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=self.CSV_BUFFER_BYTES) as f:
+            writer = csv.writer(f)
+            writer.writerow(PROFILE_FIELDS)
+            writer.writerows(profile.to_row() for profile in self.company_profiles.values())
+        
+        console.print(f"[green]Exported {len(self.company_profiles)} profiles to {output_path}[/green]")
+    
+    def export_pages_parquet(self, output_path: Path):
+        """Export scraped pages to Parquet (zstd, native list columns)."""
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        _write_parquet([
+            (
+                page.url, page.domain, page.title, page.content_hash,
+                page.scraped_at, page.status_code, page.page_type,
+                page.job_titles, page.tech_keywords, page.hiring_signals,
+                page.remote_indicators, page.contact_emails,
+                page.has_apply_button, page.has_job_listings, page.last_modified
+            )
+            for page in self.scraped_pages
+        ], PAGES_SCHEMA, output_path)
+        
+        console.print(f"[green]Exported {len(self.scraped_pages)} pages to {output_path}[/green]")
+    
+    def export_profiles_parquet(self, output_path: Path):
+        """Export company profiles to Parquet (zstd, native list columns)."""
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        _write_parquet([
+            (
+                profile.domain, profile.name, profile.careers_url or '',
+                *profile.finalize(), profile.pages_scraped,
+                profile.has_active_listings, profile.first_seen, profile.last_updated
+            )
+            for profile in self.company_profiles.values()
+        ], PROFILES_SCHEMA, output_path)
         
         console.print(f"[green]Exported {len(self.company_profiles)} profiles to {output_path}[/green]")
+    
+    def export_results(self, output_dir: Path, fmt: str = 'csv'):
+        """Export profiles and pages to output_dir as CSV or Parquet."""
+        if fmt == 'parquet':
+            self.export_profiles_parquet(output_dir / 'profiles.parquet')
+            self.export_pages_parquet(output_dir / 'pages.parquet')
+        else:
+            self.export_profiles_csv(output_dir / 'profiles.csv')
+            self.export_pages_csv(output_dir / 'pages.csv')
 
 
 # =============================================================================
@@ -765,9 +1817,14 @@ class JobMarketScraper:
 @click.option('--input', '-i', 'input_file', type=click.Path(exists=True), help='File with domains (one per line)')
 @click.option('--output', '-o', type=click.Path(), help='Output directory')
 @click.option('--max-pages', '-m', default=5, help='Max pages per domain')
+@click.option('--concurrency', '-c', default=20, help='Max domains scraped in parallel')
 @click.option('--no-robots', is_flag=True, help='Ignore robots.txt (not recommended)')
 @click.option('--no-rate-limit', is_flag=True, help='Disable rate limiting (not recommended)')
-def main(url, domain, input_file, output, max_pages, no_robots, no_rate_limit):
+@click.option('--engine', type=click.Choice(['re', 'hyperscan', 'ahocorasick']), default='re', help='Keyword matching engine')
+@click.option('--workers', '-w', default=0, help='Processes for HTML parsing/extraction with --input (0 = inline, -1 = one per CPU)')
+@click.option('--page-cache', is_flag=True, help='Revalidate previously scraped pages with conditional GETs and reuse unchanged ones')
+@click.option('--format', '-f', 'fmt', type=click.Choice(['csv', 'parquet']), default='parquet', help='Output format')
+def main(url, domain, input_file, output, max_pages, concurrency, no_robots, no_rate_limit, engine, workers, page_cache, fmt):
     """
     Scrape company websites for job market intelligence.
     
@@ -778,7 +1835,10 @@ def main(url, domain, input_file, output, max_pages, no_robots, no_rate_limit):
     """
     scraper = JobMarketScraper(
         respect_robots=not no_robots,
-        rate_limit=not no_rate_limit
+        rate_limit=not no_rate_limit,
+        engine=engine,
+        workers=workers,
+        page_cache=page_cache
     )
     
     output_dir = Path(output) if output else PROJECT_ROOT / 'output' / 'scrape_results'
@@ -804,20 +1864,18 @@ def main(url, domain, input_file, output, max_pages, no_robots, no_rate_limit):
         console.print(f"[green]Scraped {profile.pages_scraped} pages[/green]")
         
         # Export results
-        scraper.export_profiles_csv(output_dir / 'profiles.csv')
-        scraper.export_pages_csv(output_dir / 'pages.csv')
+        scraper.export_results(output_dir, fmt)
     
     elif input_file:
-        # Scrape multiple domains from file
-        with open(input_file) as f:
-            domains = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+        # Scrape multiple domains from file (materialized: the async
+        # scraper interleaves them by host, which needs the whole set)
+        domains = list(iter_domains(input_file))
         
         console.print(f"[cyan]Scraping {len(domains)} domains...[/cyan]")
-        profiles = scraper.scrape_domains(domains, max_pages)
+        profiles = scraper.scrape_domains(domains, max_pages, concurrency=concurrency)
         
         # Export results
-        scraper.export_profiles_csv(output_dir / 'profiles.csv')
-        scraper.export_pages_csv(output_dir / 'pages.csv')
+        scraper.export_results(output_dir, fmt)
         
         console.print(f"\n[bold green]Complete! Scraped {len(profiles)} domains.[/bold green]")
     
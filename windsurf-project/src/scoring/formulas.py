@@ -204,13 +204,22 @@ def calculate_lead_score(company_data: dict, config: dict) -> dict:
     """
     from datetime import datetime
     
+    # Config lookups hoisted out of the loops; each title/signal is
+    # lowercased once, not once per pattern
+    role_patterns = tuple(config.get('role_patterns', {}).items())
+    seniority_multipliers = config.get('seniority_multipliers', {})
+    tech_weights = config.get('tech_weights', {})
+    
     # 1. Role Match Score
     role_score = 0
     matched_roles = []
     for title in company_data.get('job_titles', []):
-        for pattern, weight in config.get('role_patterns', {}).items():
-            if pattern in title.lower():
-                multiplier = get_seniority_multiplier(title, config.get('seniority_multipliers', {}))
+        title_lower = title.lower()
+        multiplier = None
+        for pattern, weight in role_patterns:
+            if pattern in title_lower:
+                if multiplier is None:
+                    multiplier = get_seniority_multiplier(title_lower, seniority_multipliers)
                 score = min(weight * multiplier * 100, 100)
                 if score > role_score:
                     role_score = score
@@ -220,15 +229,15 @@ def calculate_lead_score(company_data: dict, config: dict) -> dict:
     tech_sum = 0
     matched_techs = []
     for tech in company_data.get('tech_keywords', []):
-        tech_weights = config.get('tech_weights', {})
-        if tech.lower() in tech_weights:
-            tech_sum += tech_weights[tech.lower()]
+        weight = tech_weights.get(tech.lower())
+        if weight is not None:
+            tech_sum += weight
             matched_techs.append(tech)
     tech_score = min((tech_sum / 5.0) * 100, 100)
     
     # 3. Hiring Signals Score
     hiring_score = 0
-    hiring_signals = company_data.get('hiring_signals', [])
+    hiring_signals = [signal.lower() for signal in company_data.get('hiring_signals', [])]
     if has_strong_hiring_signal(hiring_signals):
         hiring_score += 30
     if company_data.get('has_active_listings', False):
@@ -307,40 +316,40 @@ def calculate_lead_score(company_data: dict, config: dict) -> dict:
 
 
 # Helper functions (pseudo-code)
-def get_seniority_multiplier(title: str, multipliers: dict) -> float:
-    """Get seniority multiplier from title."""
-    title_lower = title.lower()
+def get_seniority_multiplier(title_lower: str, multipliers: dict) -> float:
+    """Get seniority multiplier from an already lowercased title."""
     for level, mult in multipliers.items():
         if level in title_lower:
             return mult
     return 1.0
 
 
-def has_strong_hiring_signal(signals: list) -> bool:
-    """Check for strong hiring signals."""
-    strong_patterns = ["we're hiring", "now hiring", "open positions"]
-    for signal in signals:
-        for pattern in strong_patterns:
-            if pattern in signal.lower():
+STRONG_HIRING_PATTERNS = ("we're hiring", "now hiring", "open positions")
+FUNDING_PATTERNS = ("series", "raised", "backed", "funding")
+GROWTH_PATTERNS = ("growing", "expanding", "scaling")
+
+
+def _has_any(signals_lower: list, patterns: tuple) -> bool:
+    """Whether any pattern occurs in any (already lowercased) signal."""
+    for signal in signals_lower:
+        for pattern in patterns:
+            if pattern in signal:
                 return True
     return False
 
 
-def has_funding_signal(signals: list) -> bool:
+# The has_*_signal helpers expect lowercased signals (calculate_lead_score
+# lowers them once and shares the list between all three)
+def has_strong_hiring_signal(signals_lower: list) -> bool:
+    """Check for strong hiring signals."""
+    return _has_any(signals_lower, STRONG_HIRING_PATTERNS)
+
+
+def has_funding_signal(signals_lower: list) -> bool:
     """Check for funding signals."""
-    funding_patterns = ["series", "raised", "backed", "funding"]
-    for signal in signals:
-        for pattern in funding_patterns:
-            if pattern in signal.lower():
-                return True
-    return False
+    return _has_any(signals_lower, FUNDING_PATTERNS)
 
 
-def has_growth_signal(signals: list) -> bool:
+def has_growth_signal(signals_lower: list) -> bool:
     """Check for growth signals."""
-    growth_patterns = ["growing", "expanding", "scaling"]
-    for signal in signals:
-        for pattern in growth_patterns:
-            if pattern in signal.lower():
-                return True
-    return False
+    return _has_any(signals_lower, GROWTH_PATTERNS)
@@ -18,23 +18,48 @@ import sys
 import json
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Optional, Set, Tuple
+from typing import List, Dict, Optional, Set, Tuple, Union
 from dataclasses import dataclass, field, asdict
-import csv
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 
-import yaml
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from rich.console import Console
-from rich.table import Table
 from rich.progress import Progress
 import click
 
+from src.utils.yaml_cache import read_yaml
+
 console = Console()
 
+# Above this many rows, tables print as plain aligned text (Rich layout
+# measures every cell, which dominates for long listings)
+PLAIN_TABLE_ROWS = 200
+
 
 # =============================================================================
 # SCORING CONFIGURATION
@@ -79,6 +104,20 @@ class ScoringConfig:
 # SCORING DATA STRUCTURES
 # =============================================================================
 
+def _json_list(values: List[str]) -> str:
+    """JSON text of a list column (orjson when installed: compact, non-ASCII kept as UTF-8)."""
+    if HAS_ORJSON:
+        return orjson.dumps(values).decode('utf-8')
+    return json.dumps(values)
+
+
+def _parse_json_list(text: str) -> List[str]:
+    """Parse a JSON list cell (empty cell = empty list), with orjson when installed."""
+    if not text:
+        return []
+    return orjson.loads(text) if HAS_ORJSON else json.loads(text)
+
+
 @dataclass
 class LeadScore:
     """Detailed score breakdown for a lead."""
@@ -110,21 +149,106 @@ class LeadScore:
     # Metadata
     scored_at: datetime = field(default_factory=datetime.now)
     
+    def to_row(self) -> tuple:
+        """Flat values in SCORE_FIELDS order (scores rounded, lists as JSON)."""
+        return (
+            self.domain,
+            round(self.total_score, 2),
+            self.priority,
+            round(self.role_score, 2),
+            round(self.tech_score, 2),
+            round(self.hiring_score, 2),
+            round(self.company_score, 2),
+            round(self.recency_score, 2),
+            _json_list(self.matched_roles),
+            _json_list(self.matched_techs),
+            _json_list(self.matched_signals),
+            self.scored_at.isoformat(),
+        )
+    
     def to_dict(self) -> dict:
-        return {
-            'domain': self.domain,
-            'total_score': round(self.total_score, 2),
-            'priority': self.priority,
-            'role_score': round(self.role_score, 2),
-            'tech_score': round(self.tech_score, 2),
-            'hiring_score': round(self.hiring_score, 2),
-            'company_score': round(self.company_score, 2),
-            'recency_score': round(self.recency_score, 2),
-            'matched_roles': json.dumps(self.matched_roles),
-            'matched_techs': json.dumps(self.matched_techs),
-            'matched_signals': json.dumps(self.matched_signals),
-            'scored_at': self.scored_at.isoformat()
-        }
+        return dict(zip(SCORE_FIELDS, self.to_row()))
+
+
+SCORE_FIELDS = (
+    'domain', 'total_score', 'priority', 'role_score', 'tech_score',
+    'hiring_score', 'company_score', 'recency_score', 'matched_roles',
+    'matched_techs', 'matched_signals', 'scored_at',
+)
+
+
+@dataclass
+class ScoreBatch:
+    """
+    Scores for many companies as parallel arrays, one row per company.
+    
+    Sorting and filtering index the arrays; LeadScore objects are only
+    built (to_lead_scores) for the rows that get displayed or exported.
+    """
+    domains: List[str]
+    total: np.ndarray  # (N,)
+    components: np.ndarray  # (N, 5): role, tech, hiring, company, recency
+    contributions: np.ndarray  # (N, 5): components * weights
+    priority: np.ndarray  # (N,): 'high', 'medium' or 'low'
+    matches: List[Tuple[List[str], List[str], List[str]]]  # (roles, techs, signals)
+    scored_at: datetime = field(default_factory=datetime.now)
+    
+    def __len__(self) -> int:
+        return len(self.domains)
+    
+    def take(self, index: np.ndarray) -> 'ScoreBatch':
+        """The rows selected by an index array or boolean mask, in that order."""
+        if index.dtype == bool:
+            index = np.flatnonzero(index)
+        rows = index.tolist()
+        return ScoreBatch(
+            domains=[self.domains[i] for i in rows],
+            total=self.total[index],
+            components=self.components[index],
+            contributions=self.contributions[index],
+            priority=self.priority[index],
+            matches=[self.matches[i] for i in rows],
+            scored_at=self.scored_at
+        )
+    
+    def count(self, priority: str) -> int:
+        """Number of rows with the given priority."""
+        return int(np.count_nonzero(self.priority == priority))
+    
+    def to_lead_scores(self, limit: Optional[int] = None) -> List[LeadScore]:
+        """The first limit rows (all by default) as LeadScore objects."""
+        n = len(self) if limit is None else min(limit, len(self))
+        totals = self.total[:n].tolist()
+        components = self.components[:n].tolist()
+        contributions = self.contributions[:n].tolist()
+        priorities = self.priority[:n].tolist()
+        
+        scores = []
+        for i in range(n):
+            role, tech, hiring, company, recency = components[i]
+            role_c, tech_c, hiring_c, company_c, recency_c = contributions[i]
+            matched_roles, matched_techs, matched_signals = self.matches[i]
+            scores.append(LeadScore(
+                domain=self.domains[i],
+                total_score=totals[i],
+                role_score=role,
+                tech_score=tech,
+                hiring_score=hiring,
+                company_score=company,
+                recency_score=recency,
+                role_contribution=role_c,
+                tech_contribution=tech_c,
+                hiring_contribution=hiring_c,
+                company_contribution=company_c,
+                recency_contribution=recency_c,
+                matched_roles=matched_roles,
+                matched_techs=matched_techs,
+                matched_signals=matched_signals,
+                priority=priorities[i],
+                scored_at=self.scored_at
+            ))
+        
+        return scores
 
 
 @dataclass
@@ -147,6 +271,89 @@ class CompanyData:
     last_updated: Optional[datetime] = None
 
 
+# =============================================================================
+# PATTERN MATCHING
+# =============================================================================
+
+def _build_automaton(items) -> Optional['ahocorasick.Automaton']:
+    """
+    Aho-Corasick automaton over (pattern, value) pairs, so one scan of a
+    string finds every pattern in it. None without pyahocorasick (or with
+    no patterns / an empty one); callers then fall back to substring loops.
+    """
+    items = list(items)
+    if not HAS_AHOCORASICK or not items or not all(pattern for pattern, _ in items):
+        return None
+    automaton = ahocorasick.Automaton()
+    for pattern, value in items:
+        automaton.add_word(pattern, value)
+    automaton.make_automaton()
+    return automaton
+
+
+# =============================================================================
+# BATCH KERNELS
+# =============================================================================
+
+def _score_kernel_numpy(
+    components: np.ndarray,
+    weights: np.ndarray,
+    age_days: np.ndarray,
+    fresh_days: float,
+    stale_days: float
+) -> np.ndarray:
+    """
+    Fill the recency column of components and return total scores.
+    
+    components is (N, 5) in (role, tech, hiring, company, recency) order;
+    age_days is NaN where last_updated is unknown (neutral score of 50).
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        decayed = 100.0 * (1 - (age_days - fresh_days) / (stale_days - fresh_days))
+    components[:, 4] = np.select(
+        [np.isnan(age_days), age_days <= fresh_days, age_days >= stale_days],
+        [50.0, 100.0, 0.0],
+        default=decayed
+    )
+    contributions = components * weights
+    return (
+        contributions[:, 0] +
+        contributions[:, 1] +
+        contributions[:, 2] +
+        contributions[:, 3] +
+        contributions[:, 4]
+    )
+
+
+if HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _score_kernel(components, weights, age_days, fresh_days, stale_days):
+        """Numba version of _score_kernel_numpy (same semantics)."""
+        n = components.shape[0]
+        total = np.empty(n)
+        for i in prange(n):
+            age = age_days[i]
+            if np.isnan(age):
+                recency = 50.0
+            elif age <= fresh_days:
+                recency = 100.0
+            elif age >= stale_days:
+                recency = 0.0
+            else:
+                recency = 100.0 * (1 - (age - fresh_days) / (stale_days - fresh_days))
+            components[i, 4] = recency
+            total[i] = (
+                components[i, 0] * weights[0] +
+                components[i, 1] * weights[1] +
+                components[i, 2] * weights[2] +
+                components[i, 3] * weights[3] +
+                recency * weights[4]
+            )
+        return total
+else:
+    _score_kernel = _score_kernel_numpy
+
+
 # =============================================================================
 # SCORING ENGINE
 # =============================================================================
@@ -169,10 +376,28 @@ class LeadScorer:
     Final score is 0-100.
     """
     
-    def __init__(self, config: Optional[ScoringConfig] = None, config_path: Optional[Path] = None):
+    STRONG_SIGNALS = ('hiring:', 'we\'re hiring', 'now hiring', 'open positions')
+    FUNDING_KEYWORDS = ('series', 'raised', 'backed', 'funding', 'yc', 'combinator')
+    GROWTH_KEYWORDS = ('growing', 'expanding', 'scaling')
+    
+    # Companies per task handed to a worker process, and the batch size
+    # below which spawning workers (~1s each to import) isn't worth it
+    POOL_CHUNK = 1000
+    POOL_MIN_COMPANIES = 20000
+    
+    def __init__(
+        self,
+        config: Optional[ScoringConfig] = None,
+        config_path: Optional[Path] = None,
+        workers: int = 0
+    ):
         self.config = config or self._load_config(config_path)
         self._load_keywords()
         self._load_roles()
+        
+        # score_companies keyword matching in this many processes
+        # (<= 1 runs inline, negative means one per CPU)
+        self.workers = workers if workers >= 0 else (os.cpu_count() or 1)
     
     def _load_config(self, config_path: Optional[Path]) -> ScoringConfig:
         """Load scoring configuration from YAML."""
@@ -185,26 +410,25 @@ class LeadScorer:
         config = ScoringConfig()
         
         if config_path.exists():
-            with open(config_path) as f:
-                data = yaml.safe_load(f)
-                
-                # Load weights
-                weights_data = data.get('scoring', {}).get('weights', {})
-                config.weights = ScoringWeights(
-                    role_match=weights_data.get('role_match', 0.30),
-                    tech_match=weights_data.get('tech_match', 0.25),
-                    hiring_signals=weights_data.get('hiring_signals', 0.20),
-                    company_signals=weights_data.get('company_signals', 0.15),
-                    recency=weights_data.get('recency', 0.10)
-                )
-                
-                # Load thresholds
-                config.min_lead_score = data.get('scoring', {}).get('min_lead_score', 40)
-                config.high_priority_score = data.get('scoring', {}).get('high_priority_score', 70)
-                
-                # Load target roles
-                config.target_roles = data.get('profile', {}).get('target_roles', [])
-                config.target_seniority = data.get('profile', {}).get('seniority', [])
+            data = read_yaml(config_path)
+            
+            # Load weights
+            weights_data = data.get('scoring', {}).get('weights', {})
+            config.weights = ScoringWeights(
+                role_match=weights_data.get('role_match', 0.30),
+                tech_match=weights_data.get('tech_match', 0.25),
+                hiring_signals=weights_data.get('hiring_signals', 0.20),
+                company_signals=weights_data.get('company_signals', 0.15),
+                recency=weights_data.get('recency', 0.10)
+            )
+            
+            # Load thresholds
+            config.min_lead_score = data.get('scoring', {}).get('min_lead_score', 40)
+            config.high_priority_score = data.get('scoring', {}).get('high_priority_score', 70)
+            
+            # Load target roles
+            config.target_roles = data.get('profile', {}).get('target_roles', [])
+            config.target_seniority = data.get('profile', {}).get('seniority', [])
         
         return config
     
@@ -214,17 +438,16 @@ class LeadScorer:
         self.tech_weights = {}
         
         if keywords_path.exists():
-            with open(keywords_path) as f:
-                data = yaml.safe_load(f)
-                
-                for category in ['languages', 'data_ml', 'infrastructure', 'databases']:
-                    if category in data:
-                        for keyword, info in data[category].items():
-                            weight = info.get('weight', 0.5)
-                            self.tech_weights[keyword.lower()] = weight
-                            # Add aliases
-                            for alias in info.get('aliases', []):
-                                self.tech_weights[alias.lower()] = weight
+            data = read_yaml(keywords_path)
+            
+            for category in ['languages', 'data_ml', 'infrastructure', 'databases']:
+                if category in data:
+                    for keyword, info in data[category].items():
+                        weight = info.get('weight', 0.5)
+                        self.tech_weights[keyword.lower()] = weight
+                        # Add aliases
+                        for alias in info.get('aliases', []):
+                            self.tech_weights[alias.lower()] = weight
         
         # Fallback defaults
         if not self.tech_weights:
@@ -240,24 +463,23 @@ class LeadScorer:
         self.seniority_multipliers = {}
         
         if roles_path.exists():
-            with open(roles_path) as f:
-                data = yaml.safe_load(f)
-                
-                # Primary roles
-                for role_name, info in data.get('primary_roles', {}).items():
-                    for pattern in info.get('patterns', []):
-                        self.role_patterns[pattern.lower()] = info.get('weight', 1.0)
-                
-                # Secondary roles
-                for role_name, info in data.get('secondary_roles', {}).items():
-                    for pattern in info.get('patterns', []):
-                        self.role_patterns[pattern.lower()] = info.get('weight', 0.7)
-                
-                # Seniority
-                for level, info in data.get('seniority', {}).items():
-                    for pattern in info.get('patterns', []):
-                        if pattern:
-                            self.seniority_multipliers[pattern.lower()] = info.get('multiplier', 1.0)
+            data = read_yaml(roles_path)
+            
+            # Primary roles
+            for role_name, info in data.get('primary_roles', {}).items():
+                for pattern in info.get('patterns', []):
+                    self.role_patterns[pattern.lower()] = info.get('weight', 1.0)
+            
+            # Secondary roles
+            for role_name, info in data.get('secondary_roles', {}).items():
+                for pattern in info.get('patterns', []):
+                    self.role_patterns[pattern.lower()] = info.get('weight', 0.7)
+            
+            # Seniority
+            for level, info in data.get('seniority', {}).items():
+                for pattern in info.get('patterns', []):
+                    if pattern:
+                        self.seniority_multipliers[pattern.lower()] = info.get('multiplier', 1.0)
         
         # Fallback defaults
         if not self.role_patterns:
@@ -265,6 +487,44 @@ class LeadScorer:
                 'data engineer': 1.0, 'backend engineer': 1.0, 'ml engineer': 1.0,
                 'software engineer': 0.7, 'python developer': 0.9
             }
+        
+        # Seniority values carry their config order: the first listed
+        # pattern found in a title wins, as in the loop fallback
+        self._role_items = tuple(self.role_patterns.items())
+        self._seniority_items = tuple(self.seniority_multipliers.items())
+        self._role_ac = _build_automaton(self.role_patterns.items())
+        self._seniority_ac = _build_automaton(
+            (pattern, (order, mult))
+            for order, (pattern, mult) in enumerate(self.seniority_multipliers.items())
+        )
+    
+    def _seniority_multiplier(self, title_lower: str) -> float:
+        """Multiplier of the first configured seniority pattern in the title (1.0 if none)."""
+        if self._seniority_ac is not None:
+            hits = [value for _, value in self._seniority_ac.iter(title_lower)]
+            return min(hits)[1] if hits else 1.0
+        
+        for seniority, mult in self._seniority_items:
+            if seniority in title_lower:
+                return mult
+        return 1.0
+    
+    def _best_role_weight(self, title_lower: str) -> Optional[float]:
+        """Highest weight among role patterns found in the title (None if none)."""
+        if self._role_ac is not None:
+            return max((weight for _, weight in self._role_ac.iter(title_lower)), default=None)
+        
+        return max(
+            (weight for pattern, weight in self._role_items if pattern in title_lower),
+            default=None
+        )
+    
+    def _has_role(self, title_lower: str) -> bool:
+        """Whether any role pattern occurs in the title."""
+        if self._role_ac is not None:
+            return next(self._role_ac.iter(title_lower), None) is not None
+        
+        return any(pattern in title_lower for pattern, _ in self._role_items)
     
     def score_role_match(self, company: CompanyData) -> Tuple[float, List[str]]:
         """
@@ -284,22 +544,24 @@ class LeadScorer:
         for title in company.job_titles:
             title_lower = title.lower()
             
-            # Check role patterns
-            for pattern, weight in self.role_patterns.items():
-                if pattern in title_lower:
-                    # Apply seniority multiplier
-                    multiplier = 1.0
-                    for seniority, mult in self.seniority_multipliers.items():
-                        if seniority in title_lower:
-                            multiplier = mult
-                            break
-                    
-                    score = weight * multiplier * 100
-                    if score > best_score:
-                        best_score = score
-                    
-                    if title not in matched:
-                        matched.append(title)
+            # Once the score is capped, later titles only decide membership
+            # in matched: skip the weight and seniority lookups
+            if best_score >= 100.0:
+                if title not in matched and self._has_role(title_lower):
+                    matched.append(title)
+                continue
+            
+            # Best role pattern, scaled by the seniority multiplier
+            weight = self._best_role_weight(title_lower)
+            if weight is None:
+                continue
+            
+            score = weight * self._seniority_multiplier(title_lower) * 100
+            if score > best_score:
+                best_score = score
+            
+            if title not in matched:
+                matched.append(title)
         
         return min(best_score, 100.0), matched
     
@@ -343,7 +605,7 @@ class LeadScorer:
         matched = []
         
         # Check for strong hiring signals
-        strong_signals = ['hiring:', 'we\'re hiring', 'now hiring', 'open positions']
+        strong_signals = self.STRONG_SIGNALS
         for signal in company.hiring_signals:
             signal_lower = signal.lower()
             for strong in strong_signals:
@@ -378,7 +640,7 @@ class LeadScorer:
         matched = []
         
         # Check funding signals
-        funding_keywords = ['series', 'raised', 'backed', 'funding', 'yc', 'combinator']
+        funding_keywords = self.FUNDING_KEYWORDS
         for signal in company.hiring_signals:
             signal_lower = signal.lower()
             for keyword in funding_keywords:
@@ -388,7 +650,7 @@ class LeadScorer:
                     break
         
         # Growth signals
-        growth_keywords = ['growing', 'expanding', 'scaling']
+        growth_keywords = self.GROWTH_KEYWORDS
         for signal in company.hiring_signals:
             signal_lower = signal.lower()
             for keyword in growth_keywords:
@@ -433,6 +695,44 @@ class LeadScorer:
             days_past_fresh = age_days - self.config.fresh_days
             return 100.0 * (1 - days_past_fresh / decay_range)
     
+    def _match_components(self, company: CompanyData) -> Tuple[Tuple[float, ...], Tuple[List[str], ...]]:
+        """
+        Calculate the four keyword-driven component scores for a company.
+        
+        Returns:
+            ((role, tech, hiring, company), (matched_roles, matched_techs, matched_signals))
+        """
+        role_score, matched_roles = self.score_role_match(company)
+        tech_score, matched_techs = self.score_tech_match(company)
+        hiring_score, hiring_signals = self.score_hiring_signals(company)
+        company_score, company_signals = self.score_company_signals(company)
+        
+        return (
+            (role_score, tech_score, hiring_score, company_score),
+            (matched_roles, matched_techs, hiring_signals + company_signals)
+        )
+    
+    def _score_components(self, company: CompanyData) -> Tuple[Tuple[float, ...], Tuple[List[str], ...]]:
+        """
+        Calculate the five raw component scores for a company.
+        
+        Returns:
+            ((role, tech, hiring, company, recency), (matched_roles, matched_techs, matched_signals))
+        """
+        scores, matched = self._match_components(company)
+        return scores + (self.score_recency(company),), matched
+    
+    def _weight_vector(self) -> np.ndarray:
+        """Component weights in (role, tech, hiring, company, recency) order."""
+        weights = self.config.weights
+        return np.array([
+            weights.role_match,
+            weights.tech_match,
+            weights.hiring_signals,
+            weights.company_signals,
+            weights.recency
+        ])
+    
     def score_company(self, company: CompanyData) -> LeadScore:
         """
         Calculate full score for a company.
@@ -443,11 +743,8 @@ class LeadScorer:
         weights = self.config.weights
         
         # Calculate component scores
-        role_score, matched_roles = self.score_role_match(company)
-        tech_score, matched_techs = self.score_tech_match(company)
-        hiring_score, hiring_signals = self.score_hiring_signals(company)
-        company_score, company_signals = self.score_company_signals(company)
-        recency_score = self.score_recency(company)
+        (role_score, tech_score, hiring_score, company_score, recency_score), \
+            (matched_roles, matched_techs, matched_signals) = self._score_components(company)
         
         # Calculate weighted contributions
         role_contribution = role_score * weights.role_match
@@ -488,37 +785,109 @@ class LeadScorer:
             recency_contribution=recency_contribution,
             matched_roles=matched_roles,
             matched_techs=matched_techs,
-            matched_signals=hiring_signals + company_signals,
+            matched_signals=matched_signals,
             priority=priority
         )
     
     def score_companies(self, companies: List[CompanyData]) -> List[LeadScore]:
-        """Score multiple companies and sort by score."""
-        scores = []
+        """Score multiple companies and sort by score (see score_batch)."""
+        return self.score_batch(companies).to_lead_scores()
+    
+    def score_batch(self, companies: List[CompanyData]) -> ScoreBatch:
+        """
+        Score multiple companies into a ScoreBatch, highest total first.
+        
+        Keyword matching runs per company (in self.workers processes, in
+        chunks, when workers > 1); recency, weighting, totals, priority
+        classification and sorting run once over the whole batch
+        (JIT-compiled with Numba when available, NumPy otherwise).
+        """
+        components = np.zeros((len(companies), 5))
+        age_days = np.full(len(companies), np.nan)
+        matches = []
+        now = datetime.now()
+        
+        # Advance the bar in ~200 steps; a Rich update per company costs
+        # more than scoring it
+        step = max(1, len(companies) // 200)
         
         with Progress() as progress:
             task = progress.add_task("[cyan]Scoring leads...", total=len(companies))
             
-            for company in companies:
-                score = self.score_company(company)
-                scores.append(score)
-                progress.update(task, advance=1)
+            if self.workers > 1 and len(companies) >= self.POOL_MIN_COMPANIES:
+                chunks = [
+                    companies[start:start + self.POOL_CHUNK]
+                    for start in range(0, len(companies), self.POOL_CHUNK)
+                ]
+                # Workers get this scorer pickled once, so they match with
+                # exactly its patterns and weights. Spawned, not forked:
+                # forking after the Numba kernel's thread pool has started
+                # hangs the parent at exit
+                with ProcessPoolExecutor(
+                    self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_score_worker,
+                    initargs=(self,)
+                ) as pool:
+                    for chunk_results in pool.map(_match_in_worker, chunks):
+                        for scores, matched in chunk_results:
+                            components[len(matches), :4] = scores
+                            matches.append(matched)
+                        progress.update(task, completed=len(matches))
+            else:
+                for i, company in enumerate(companies):
+                    scores, matched = self._match_components(company)
+                    components[i, :4] = scores
+                    matches.append(matched)
+                    if (i + 1) % step == 0:
+                        progress.update(task, completed=i + 1)
+            
+            progress.update(task, completed=len(companies))
         
-        # Sort by total score descending
-        scores.sort(key=lambda x: x.total_score, reverse=True)
+        for i, company in enumerate(companies):
+            if company.last_updated:
+                age_days[i] = (now - company.last_updated).days
         
-        return scores
+        weights = self._weight_vector()
+        total = _score_kernel(
+            components, weights, age_days,
+            float(self.config.fresh_days), float(self.config.stale_days)
+        )
+        contributions = components * weights
+        priorities = np.select(
+            [total >= self.config.high_priority_score, total >= self.config.min_lead_score],
+            ['high', 'medium'],
+            default='low'
+        )
+        
+        batch = ScoreBatch(
+            domains=[company.domain for company in companies],
+            total=total,
+            components=components,
+            contributions=contributions,
+            priority=priorities,
+            matches=matches
+        )
+        
+        # Sort by total score descending (stable, like list.sort)
+        return batch.take(np.argsort(-total, kind='stable'))
     
     def filter_leads(
         self,
-        scores: List[LeadScore],
+        scores: Union[List[LeadScore], ScoreBatch],
         min_score: Optional[float] = None,
         priority: Optional[str] = None
-    ) -> List[LeadScore]:
-        """Filter scored leads by criteria."""
+    ) -> Union[List[LeadScore], ScoreBatch]:
+        """Filter scored leads by criteria (a ScoreBatch is filtered with a mask)."""
         if min_score is None:
             min_score = self.config.min_lead_score
         
+        if isinstance(scores, ScoreBatch):
+            mask = scores.total >= min_score
+            if priority:
+                mask &= scores.priority == priority
+            return scores.take(mask)
+        
         filtered = [s for s in scores if s.total_score >= min_score]
         
         if priority:
@@ -526,8 +895,17 @@ class LeadScorer:
         
         return filtered
     
-    def display_scores(self, scores: List[LeadScore], limit: int = 20):
+    def display_scores(self, scores: Union[List[LeadScore], ScoreBatch], limit: int = 20):
         """Display scores in a formatted table."""
+        if isinstance(scores, ScoreBatch):
+            scores = scores.to_lead_scores(limit)
+        
+        if min(limit, len(scores)) > PLAIN_TABLE_ROWS or not console.is_terminal:
+            self._display_scores_plain(scores[:limit])
+            return
+        
+        from rich.table import Table
+        
         table = Table(title=f"Top {min(limit, len(scores))} Leads")
         
         table.add_column("Domain", style="cyan")
@@ -557,62 +935,143 @@ class LeadScorer:
         
         console.print(table)
     
+    def _display_scores_plain(self, scores: List[LeadScore]):
+        """Print scores as plain fixed-width text, built in one join."""
+        lines = [f"Top {len(scores)} Leads", f"{'Domain':<32} {'Score':>6} {'Priority':<8} {'Role':>5} {'Tech':>5} {'Hiring':>6}  Matched Roles"]
+        lines.extend(
+            f"{s.domain:<32} {s.total_score:>6.1f} {s.priority:<8} {s.role_score:>5.0f} "
+            f"{s.tech_score:>5.0f} {s.hiring_score:>6.0f}  {', '.join(s.matched_roles[:2]) or '-'}"
+            for s in scores
+        )
+        console.out('\n'.join(lines), highlight=False)
+    
+    # Large write buffer: rows are small and a CSV export is one sequential write
+    CSV_BUFFER_BYTES = 1 << 20
+    
     def export_csv(self, scores: List[LeadScore], output_path: Path):
         """Export scores to CSV."""
+        import csv
+        
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=self.CSV_BUFFER_BYTES) as f:
             if scores:
-                fieldnames = list(scores[0].to_dict().keys())
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                for score in scores:
-                    writer.writerow(score.to_dict())
+                writer = csv.writer(f)
+                writer.writerow(SCORE_FIELDS)
+                writer.writerows(score.to_row() for score in scores)
         
         console.print(f"[green]Exported {len(scores)} scores to {output_path}[/green]")
 
 
+# Worker-process state for scoring pools (see _init_score_worker)
+_worker_scorer: Optional[LeadScorer] = None
+
+
+def _init_score_worker(scorer: LeadScorer):
+    """ProcessPoolExecutor initializer: keep the parent's scorer once per process."""
+    global _worker_scorer
+    _worker_scorer = scorer
+
+
+def _match_in_worker(companies: List[CompanyData]) -> List[Tuple[Tuple[float, ...], Tuple[List[str], ...]]]:
+    """_match_components for a chunk of companies with the worker's scorer."""
+    return [_worker_scorer._match_components(company) for company in companies]
+
+
 # =============================================================================
 # DATA LOADING
 # =============================================================================
 
+PROFILE_LIST_COLUMNS = ('job_titles', 'tech_keywords', 'hiring_signals', 'remote_indicators', 'contact_emails')
+PROFILE_DATE_COLUMNS = ('first_seen', 'last_updated')
+
+
+def _to_datetime(value) -> Optional[datetime]:
+    """Convert a pandas timestamp cell to datetime (None for NaT/missing)."""
+    if value is None or pd.isna(value):
+        return None
+    return pd.Timestamp(value).to_pydatetime()
+
+
+def _column(df: pd.DataFrame, col: str, default) -> list:
+    """A column as a Python list (default on every row when the column is absent)."""
+    return df[col].tolist() if col in df.columns else [default] * len(df)
+
+
+def _datetime_column(df: pd.DataFrame, col: str) -> List[Optional[datetime]]:
+    """A datetime column as datetimes, None for NaT/missing (converted in one pass)."""
+    if col not in df.columns:
+        return [None] * len(df)
+    
+    series = df[col]
+    if not pd.api.types.is_datetime64_any_dtype(series):
+        return [_to_datetime(value) for value in series]
+    
+    values = series.array.to_pydatetime().tolist()
+    return [None if missing else value for value, missing in zip(values, series.isna().tolist())]
+
+
+def _companies_from_frame(df: pd.DataFrame) -> List[CompanyData]:
+    """Build CompanyData from a typed profiles frame (list and datetime columns)."""
+    # Column-wise rather than to_dict('records'): no per-row dict and
+    # no per-cell Timestamp conversion
+    columns = zip(
+        _column(df, 'domain', ''), _column(df, 'name', ''), _column(df, 'careers_url', ''),
+        *(_column(df, col, []) for col in PROFILE_LIST_COLUMNS),
+        _column(df, 'has_active_listings', False), _column(df, 'pages_scraped', 0),
+        *(_datetime_column(df, col) for col in PROFILE_DATE_COLUMNS)
+    )
+    
+    return [
+        CompanyData(
+            domain=domain or '',
+            name=name or '',
+            careers_url=careers_url or '',
+            job_titles=list(job_titles),
+            tech_keywords=list(tech_keywords),
+            hiring_signals=list(hiring_signals),
+            remote_indicators=list(remote_indicators),
+            contact_emails=list(contact_emails),
+            has_active_listings=bool(has_active_listings),
+            pages_scraped=int(pages_scraped),
+            first_seen=first_seen,
+            last_updated=last_updated
+        )
+        for (domain, name, careers_url, job_titles, tech_keywords, hiring_signals,
+             remote_indicators, contact_emails, has_active_listings, pages_scraped,
+             first_seen, last_updated) in columns
+    ]
+
+
 def load_companies_from_csv(csv_path: Path) -> List[CompanyData]:
     """Load company data from CSV (output of scraper)."""
-    companies = []
-    
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        
-        for row in reader:
-            company = CompanyData(
-                domain=row.get('domain', ''),
-                name=row.get('name', ''),
-                careers_url=row.get('careers_url', ''),
-                job_titles=json.loads(row.get('job_titles', '[]')),
-                tech_keywords=json.loads(row.get('tech_keywords', '[]')),
-                hiring_signals=json.loads(row.get('hiring_signals', '[]')),
-                remote_indicators=json.loads(row.get('remote_indicators', '[]')),
-                contact_emails=json.loads(row.get('contact_emails', '[]')),
-                has_active_listings=row.get('has_active_listings', '').lower() == 'true',
-                pages_scraped=int(row.get('pages_scraped', 0))
-            )
-            
-            # Parse dates
-            if row.get('first_seen'):
-                try:
-                    company.first_seen = datetime.fromisoformat(row['first_seen'])
-                except ValueError:
-                    pass
-            
-            if row.get('last_updated'):
-                try:
-                    company.last_updated = datetime.fromisoformat(row['last_updated'])
-                except ValueError:
-                    pass
-            
-            companies.append(company)
+    # Arrow parser; everything as str so empty cells stay '' rather than NaN
+    df = pd.read_csv(csv_path, engine='pyarrow', dtype=str, keep_default_na=False)
+    
+    for col in PROFILE_LIST_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].map(_parse_json_list)
+    if 'has_active_listings' in df.columns:
+        df['has_active_listings'] = df['has_active_listings'].str.lower() == 'true'
+    if 'pages_scraped' in df.columns:
+        df['pages_scraped'] = pd.to_numeric(df['pages_scraped'], errors='coerce').fillna(0).astype(int)
+    for col in PROFILE_DATE_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], errors='coerce', format='ISO8601')
     
-    return companies
+    return _companies_from_frame(df)
+
+
+def load_companies_from_parquet(parquet_path: Path) -> List[CompanyData]:
+    """Load company data from Parquet (output of scraper --format parquet)."""
+    return _companies_from_frame(pd.read_parquet(parquet_path))
+
+
+def load_companies(path: Path) -> List[CompanyData]:
+    """Load company data, dispatching on file extension (.parquet or .csv)."""
+    if path.suffix == '.parquet':
+        return load_companies_from_parquet(path)
+    return load_companies_from_csv(path)
 
 
 # =============================================================================
@@ -620,13 +1079,14 @@ def load_companies_from_csv(csv_path: Path) -> List[CompanyData]:
 # =============================================================================
 
 @click.command()
-@click.option('--input', '-i', 'input_file', type=click.Path(exists=True), help='Input CSV with company profiles')
+@click.option('--input', '-i', 'input_file', type=click.Path(exists=True), help='Input profiles CSV or Parquet')
 @click.option('--output', '-o', type=click.Path(), help='Output CSV path')
 @click.option('--min-score', '-m', type=float, help='Minimum score threshold')
 @click.option('--priority', '-p', type=click.Choice(['high', 'medium', 'low']), help='Filter by priority')
 @click.option('--limit', '-l', default=50, help='Max leads to display/export')
 @click.option('--show-all', is_flag=True, help='Show all scores including low priority')
-def main(input_file, output, min_score, priority, limit, show_all):
+@click.option('--workers', '-w', default=0, help='Processes for keyword matching (0 = inline, -1 = one per CPU)')
+def main(input_file, output, min_score, priority, limit, show_all, workers):
     """
     Score company leads based on job market signals.
     
@@ -635,22 +1095,26 @@ def main(input_file, output, min_score, priority, limit, show_all):
         python scorer.py --input profiles.csv --priority high --limit 20
     """
     if not input_file:
-        # Try default location
-        default_input = PROJECT_ROOT / 'output' / 'scrape_results' / 'profiles.csv'
-        if default_input.exists():
-            input_file = str(default_input)
+        # Try default locations (Parquet preferred, as scrape writes it by default)
+        results_dir = PROJECT_ROOT / 'output' / 'scrape_results'
+        existing = [
+            results_dir / name for name in ('profiles.parquet', 'profiles.csv')
+            if (results_dir / name).exists()
+        ]
+        if existing:
+            input_file = str(existing[0])
         else:
-            console.print("[red]Please provide --input CSV file[/red]")
+            console.print("[red]Please provide --input profiles file[/red]")
             raise click.Abort()
     
     # Load data
     console.print(f"[cyan]Loading companies from {input_file}...[/cyan]")
-    companies = load_companies_from_csv(Path(input_file))
+    companies = load_companies(Path(input_file))
     console.print(f"[green]Loaded {len(companies)} companies[/green]")
     
     # Score
-    scorer = LeadScorer()
-    scores = scorer.score_companies(companies)
+    scorer = LeadScorer(workers=workers)
+    scores = scorer.score_batch(companies)
     
     # Filter
     if not show_all:
@@ -660,9 +1124,9 @@ def main(input_file, output, min_score, priority, limit, show_all):
     scorer.display_scores(scores, limit=limit)
     
     # Summary
-    high_count = len([s for s in scores if s.priority == 'high'])
-    medium_count = len([s for s in scores if s.priority == 'medium'])
-    low_count = len([s for s in scores if s.priority == 'low'])
+    high_count = scores.count('high')
+    medium_count = scores.count('medium')
+    low_count = scores.count('low')
     
     console.print(f"\n[bold]Summary:[/bold]")
     console.print(f"  [green]High priority:[/green] {high_count}")
@@ -675,7 +1139,7 @@ def main(input_file, output, min_score, priority, limit, show_all):
     else:
         output_path = PROJECT_ROOT / 'output' / 'reports' / f'scored_leads_{datetime.now().strftime("%Y%m%d")}.csv'
     
-    scorer.export_csv(scores[:limit], output_path)
+    scorer.export_csv(scores.to_lead_scores(limit), output_path)
 
 
 if __name__ == '__main__':
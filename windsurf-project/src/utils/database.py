@@ -7,13 +7,16 @@ Handles persistent storage of:
 - Company profiles
 - Lead scores
 - Change detection history
+- Scrape checkpoints (for resumable runs)
+- Result cache (generated dork queries)
 """
 
 import sqlite3
 import json
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterable, Tuple
 from contextlib import contextmanager
 
 
@@ -27,6 +30,8 @@ class LeadDatabase:
     - companies: Aggregated company profiles
     - scores: Lead scores with history
     - changes: Change detection log
+    - checkpoints: Content hash of each fetched URL
+    - cache: Generic key/value cache with a write timestamp
     """
     
     SCHEMA = """
@@ -126,6 +131,20 @@ class LeadDatabase:
         FOREIGN KEY (domain) REFERENCES domains(domain)
     );
     
+    -- Scrape checkpoints (content hash per fetched URL)
+    CREATE TABLE IF NOT EXISTS checkpoints (
+        url TEXT PRIMARY KEY,
+        content_hash BLOB,
+        fetched_at INTEGER  -- unix timestamp
+    );
+    
+    -- Cached results keyed by sha256 of their inputs
+    CREATE TABLE IF NOT EXISTS cache (
+        key BLOB PRIMARY KEY,
+        value BLOB,
+        ts INTEGER  -- unix timestamp
+    );
+    
     -- Indexes for common queries
     CREATE INDEX IF NOT EXISTS idx_domains_status ON domains(status);
     CREATE INDEX IF NOT EXISTS idx_pages_domain ON pages(domain);
@@ -147,6 +166,7 @@ class LeadDatabase:
     def _init_db(self):
         """Initialize database schema."""
         with self._get_connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.executescript(self.SCHEMA)
     
     @contextmanager
@@ -419,6 +439,24 @@ class LeadDatabase:
                 )
             )
     
+    def log_changes_bulk(self, changes: Iterable[Tuple[str, str, str, Any, Any]]) -> None:
+        """Log many changes in one transaction; rows are (domain, url, change_type, old_value, new_value)."""
+        with self._get_connection() as conn:
+            conn.executemany(
+                """INSERT INTO changes (domain, url, change_type, old_value, new_value)
+                   VALUES (?, ?, ?, ?, ?)""",
+                (
+                    (
+                        domain,
+                        url,
+                        change_type,
+                        json.dumps(old_value) if old_value else None,
+                        json.dumps(new_value) if new_value else None
+                    )
+                    for domain, url, change_type, old_value, new_value in changes
+                )
+            )
+    
     def get_recent_changes(self, days: int = 7) -> List[Dict]:
         """Get changes from the last N days."""
         with self._get_connection() as conn:
@@ -430,43 +468,102 @@ class LeadDatabase:
             ).fetchall()
             return [dict(row) for row in rows]
     
+    # =========================================================================
+    # CHECKPOINTS
+    # =========================================================================
+    
+    def get_checkpoint(self, url: str) -> Optional[Dict]:
+        """Get the last fetch checkpoint for a URL."""
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT * FROM checkpoints WHERE url = ?", (url,)
+            ).fetchone()
+            return dict(row) if row else None
+    
+    def save_checkpoint(self, url: str, content_hash: bytes, fetched_at: Optional[int] = None):
+        """Record the content hash and fetch time for a URL."""
+        with self._get_connection() as conn:
+            conn.execute(
+                """INSERT OR REPLACE INTO checkpoints (url, content_hash, fetched_at)
+                   VALUES (?, ?, ?)""",
+                (url, content_hash, fetched_at if fetched_at is not None else int(time.time()))
+            )
+    
+    # =========================================================================
+    # CACHE
+    # =========================================================================
+    
+    def cache_get(self, key: bytes, ttl_sec: int) -> Optional[bytes]:
+        """Get a cached value if it was written less than ttl_sec ago."""
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT value FROM cache WHERE key = ? AND ts > ?",
+                (key, int(time.time()) - ttl_sec)
+            ).fetchone()
+            return row['value'] if row else None
+    
+    def cache_set(self, key: bytes, value: bytes):
+        """Store a cached value."""
+        with self._get_connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, ts) VALUES (?, ?, ?)",
+                (key, value, int(time.time()))
+            )
+    
     # =========================================================================
     # STATISTICS
     # =========================================================================
     
+    STATS_QUERY = """
+        SELECT 'status' AS kind, status AS key, COUNT(*) AS count
+          FROM domains GROUP BY status
+        UNION ALL
+        SELECT 'pages', NULL, COUNT(*) FROM pages
+        UNION ALL
+        SELECT 'companies', NULL, COUNT(*) FROM companies
+        UNION ALL
+        SELECT 'priority', priority, COUNT(*)
+          FROM (SELECT domain, priority FROM scores
+                GROUP BY domain HAVING MAX(scored_at))
+          GROUP BY priority
+        UNION ALL
+        SELECT 'changes', NULL, COUNT(*) FROM changes
+         WHERE detected_at >= datetime('now', '-7 days')
+    """
+    
     def get_stats(self) -> Dict:
-        """Get database statistics."""
+        """Get database statistics (one aggregate query)."""
         with self._get_connection() as conn:
-            stats = {}
+            stats = {
+                'domains_by_status': {},
+                'total_pages': 0,
+                'total_companies': 0,
+                'scores_by_priority': {},
+                'changes_last_7_days': 0,
+            }
             
-            # Domain counts by status
-            rows = conn.execute(
-                "SELECT status, COUNT(*) as count FROM domains GROUP BY status"
-            ).fetchall()
-            stats['domains_by_status'] = {row['status']: row['count'] for row in rows}
-            
-            # Total pages
-            row = conn.execute("SELECT COUNT(*) as count FROM pages").fetchone()
-            stats['total_pages'] = row['count']
-            
-            # Total companies
-            row = conn.execute("SELECT COUNT(*) as count FROM companies").fetchone()
-            stats['total_companies'] = row['count']
-            
-            # Score distribution
-            rows = conn.execute(
-                """SELECT priority, COUNT(*) as count 
-                   FROM (SELECT domain, priority FROM scores 
-                         GROUP BY domain HAVING MAX(scored_at))
-                   GROUP BY priority"""
-            ).fetchall()
-            stats['scores_by_priority'] = {row['priority']: row['count'] for row in rows}
-            
-            # Recent changes
-            row = conn.execute(
-                """SELECT COUNT(*) as count FROM changes 
-                   WHERE detected_at >= datetime('now', '-7 days')"""
-            ).fetchone()
-            stats['changes_last_7_days'] = row['count']
+            for row in conn.execute(self.STATS_QUERY):
+                kind = row['kind']
+                if kind == 'status':
+                    stats['domains_by_status'][row['key']] = row['count']
+                elif kind == 'priority':
+                    stats['scores_by_priority'][row['key']] = row['count']
+                elif kind == 'pages':
+                    stats['total_pages'] = row['count']
+                elif kind == 'companies':
+                    stats['total_companies'] = row['count']
+                else:
+                    stats['changes_last_7_days'] = row['count']
             
             return stats
+    
+    def ensure_indexes(self):
+        """Create the indexes the stats/report queries rely on (idempotent)."""
+        with self._get_connection() as conn:
+            conn.executescript("""
+                CREATE INDEX IF NOT EXISTS idx_domains_status ON domains(status);
+                CREATE INDEX IF NOT EXISTS idx_scores_priority ON scores(priority);
+                CREATE INDEX IF NOT EXISTS idx_scores_domain_scored_at ON scores(domain, scored_at);
+                CREATE INDEX IF NOT EXISTS idx_changes_detected_at ON changes(detected_at);
+                ANALYZE;
+            """)
@@ -0,0 +1,26 @@
+"""
+Domain List Reader
+
+Reads domain files (one domain per line, '#' comments) for the
+scrape and detect-changes commands. The file is memory-mapped and
+scanned line by line, so nothing beyond the current line is copied
+into Python objects.
+"""
+
+import mmap
+from pathlib import Path
+from typing import Iterator, Union
+
+
+def iter_domains(path: Union[str, Path]) -> Iterator[str]:
+    """Yield stripped, non-empty, non-comment lines from a domain file."""
+    with open(path, 'rb') as f:
+        # mmap cannot map an empty file
+        if f.seek(0, 2) == 0:
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            for raw in iter(m.readline, b''):
+                line = raw.strip()
+                if line and not line.startswith(b'#'):
+                    yield line.decode('utf-8')
@@ -28,7 +28,13 @@ class RateLimitConfig:
 @dataclass
 class DomainState:
     """Tracks request state for a domain."""
-    request_times: list = field(default_factory=list)
+    # Hourly budget as a token bucket: tokens left as of refilled_at
+    # (time.monotonic); None until the domain's first request
+    tokens: Optional[float] = None
+    refilled_at: float = 0.0
+    # robots.txt Crawl-delay, enforced as a minimum gap since last_request_at
+    crawl_delay: Optional[float] = None
+    last_request_at: Optional[float] = None
     consecutive_errors: int = 0
     last_error_time: Optional[datetime] = None
     backoff_until: Optional[datetime] = None
@@ -39,8 +45,9 @@ class RateLimiter:
     Thread-safe rate limiter with per-domain tracking.
     
     Features:
-    - Configurable delays between requests
-    - Per-domain request limits
+    - Configurable delays between requests to a domain
+    - Per-domain request limits (token bucket, O(1) state per domain)
+    - robots.txt crawl-delay per domain
     - Exponential backoff on errors
     - Jitter to avoid detection patterns
     """
@@ -49,7 +56,6 @@ class RateLimiter:
         self.config = config or RateLimitConfig()
         self._domain_states: Dict[str, DomainState] = defaultdict(DomainState)
         self._lock = threading.Lock()
-        self._last_request_time: Optional[datetime] = None
     
     def _get_jittered_delay(self) -> float:
         """Get a random delay within configured bounds."""
@@ -58,10 +64,16 @@ class RateLimiter:
             self.config.max_delay_sec
         )
     
-    def _clean_old_requests(self, state: DomainState, window_minutes: int = 60):
-        """Remove request times older than the window."""
-        cutoff = datetime.now() - timedelta(minutes=window_minutes)
-        state.request_times = [t for t in state.request_times if t > cutoff]
+    def _refill(self, state: DomainState) -> float:
+        """Top up the domain's hourly token bucket and return its tokens."""
+        capacity = float(self.config.requests_per_domain_per_hour)
+        now = time.monotonic()
+        if state.tokens is None:
+            state.tokens = capacity
+        else:
+            state.tokens = min(capacity, state.tokens + (now - state.refilled_at) * capacity / 3600.0)
+        state.refilled_at = now
+        return state.tokens
     
     def can_request(self, domain: str) -> bool:
         """Check if a request to the domain is allowed."""
@@ -72,52 +84,76 @@ class RateLimiter:
             if state.backoff_until and datetime.now() < state.backoff_until:
                 return False
             
-            # Clean old requests
-            self._clean_old_requests(state)
-            
             # Check per-domain limit
-            if len(state.request_times) >= self.config.requests_per_domain_per_hour:
-                return False
-            
-            return True
+            return self._refill(state) >= 1.0
     
-    def wait_if_needed(self, domain: str) -> float:
+    def reserve(
+        self,
+        domain: str,
+        crawl_delay: Optional[float] = None,
+        min_delay: Optional[float] = None
+    ) -> float:
         """
-        Wait the appropriate amount of time before making a request.
+        Claim the domain's next request slot without sleeping.
+        
+        Pacing is per domain: backoff, then the jittered delay (or the
+        longer crawl-delay) since the domain's last request. The caller
+        sleeps the returned time (wait_if_needed, or asyncio.sleep in the
+        async scraper), so the lock is never held while waiting.
+        
+        Args:
+            domain: The domain about to be requested
+            crawl_delay: robots.txt Crawl-delay for the domain, if known;
+                remembered and enforced between requests to it
+            min_delay: Used instead of the jittered delay when given
         
         Returns:
-            The number of seconds waited
+            The number of seconds to wait before the request
         """
         with self._lock:
             state = self._domain_states[domain]
-            waited = 0.0
+            if crawl_delay is not None:
+                state.crawl_delay = crawl_delay
+            
+            now = time.monotonic()
+            ready_at = now
             
             # Wait for backoff if needed
             if state.backoff_until:
-                wait_time = (state.backoff_until - datetime.now()).total_seconds()
-                if wait_time > 0:
-                    time.sleep(wait_time)
-                    waited += wait_time
+                ready_at = max(ready_at, now + (state.backoff_until - datetime.now()).total_seconds())
                 state.backoff_until = None
             
-            # Wait for minimum delay since last request
-            if self._last_request_time:
-                elapsed = (datetime.now() - self._last_request_time).total_seconds()
-                min_delay = self._get_jittered_delay()
-                if elapsed < min_delay:
-                    sleep_time = min_delay - elapsed
-                    time.sleep(sleep_time)
-                    waited += sleep_time
-            
-            return waited
+            # Minimum delay (or the longer crawl-delay) since the domain's last request
+            if state.last_request_at is not None:
+                delay = self._get_jittered_delay() if min_delay is None else min_delay
+                ready_at = max(ready_at, state.last_request_at + max(delay, state.crawl_delay or 0.0))
+            state.last_request_at = ready_at
+        
+        return max(ready_at - now, 0.0)
+    
+    def wait_if_needed(self, domain: str, crawl_delay: Optional[float] = None) -> float:
+        """
+        Wait the appropriate amount of time before making a request.
+        
+        Args:
+            domain: The domain about to be requested
+            crawl_delay: robots.txt Crawl-delay for the domain, if known
+        
+        Returns:
+            The number of seconds waited
+        """
+        waited = self.reserve(domain, crawl_delay)
+        if waited > 0:
+            time.sleep(waited)
+        return waited
     
     def record_request(self, domain: str):
         """Record a successful request."""
         with self._lock:
             state = self._domain_states[domain]
-            state.request_times.append(datetime.now())
+            state.tokens = max(self._refill(state) - 1.0, 0.0)
+            state.last_request_at = max(state.last_request_at or 0.0, state.refilled_at)
             state.consecutive_errors = 0
-            self._last_request_time = datetime.now()
     
     def record_error(self, domain: str, is_rate_limit: bool = False):
         """
@@ -131,6 +167,7 @@ class RateLimiter:
             state = self._domain_states[domain]
             state.consecutive_errors += 1
             state.last_error_time = datetime.now()
+            state.last_request_at = max(state.last_request_at or 0.0, time.monotonic())
             
             # Calculate backoff
             if is_rate_limit or state.consecutive_errors >= 3:
@@ -146,11 +183,12 @@ class RateLimiter:
         """Get rate limiting stats for a domain."""
         with self._lock:
             state = self._domain_states[domain]
-            self._clean_old_requests(state)
+            tokens = self._refill(state)
             
             return {
                 'domain': domain,
-                'requests_last_hour': len(state.request_times),
+                'requests_last_hour': round(self.config.requests_per_domain_per_hour - tokens),
+                'crawl_delay': state.crawl_delay,
                 'consecutive_errors': state.consecutive_errors,
                 'in_backoff': state.backoff_until is not None and datetime.now() < state.backoff_until,
                 'backoff_until': state.backoff_until.isoformat() if state.backoff_until else None
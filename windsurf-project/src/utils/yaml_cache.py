@@ -0,0 +1,32 @@
+"""
+YAML Config Cache
+
+Parsed YAML shared across the modules that load config files, so
+constructing several engines/scorers parses each file once. Entries are
+keyed on path, mtime and size, so edits are picked up.
+"""
+
+import copy
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Union
+
+
+def _safe_load(stream) -> Any:
+    """yaml.safe_load via the libyaml C loader when PyYAML was built with it."""
+    import yaml
+    return yaml.load(stream, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+
+@lru_cache(maxsize=32)
+def _load_yaml_file(path_str: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file; keyed on mtime/size so edits are picked up."""
+    with open(path_str) as f:
+        return _safe_load(f)
+
+
+def read_yaml(path: Union[str, Path]) -> Any:
+    """Parsed YAML for path (cached parse, private copy for the caller)."""
+    path = Path(path)
+    st = path.stat()
+    return copy.deepcopy(_load_yaml_file(str(path), st.st_mtime_ns, st.st_size))